@@ -5,7 +5,7 @@ import random
 import string
 from datetime import date, datetime, time
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List, Optional
 from zoneinfo import ZoneInfo
 
 from fastapi import Depends, FastAPI, HTTPException, Request
@@ -32,7 +32,7 @@ from .models import (
     User,
 )
 from .nba import (
-    get_box_score_for_player,
+    get_box_map,
     get_games_by_date,
     get_player_name,
     get_players_for_game,
@@ -651,11 +651,15 @@ def score_day(code: str, date: str, db: Session = Depends(get_db)):
         .all()
     )
     results: List[PickResultOut] = []
+    # One games-list fetch and one box score fetch per game for the whole
+    # request, shared across picks (games stays None until a pick needs it).
+    games: Optional[List[Dict[str, Any]]] = None
+    box_by_game: Dict[str, Dict[int, Dict[str, float]]] = {}
     for pick in picks:
         if pick.status == PickStatus.scored:
             if pick.result:
                 results.append(
-                    PickResultOut(
+                    PickResultOut.model_construct(
                         pick_id=pick.id,
                         score=pick.result.score,
                         breakdown=pick.result.breakdown_json,
@@ -681,9 +685,12 @@ def score_day(code: str, date: str, db: Session = Depends(get_db)):
                     "minutes": stat.minutes,
                 }
         if not actual:
-            games = get_games_by_date(date)
+            if games is None:
+                games = get_games_by_date(date)
             for game in games:
-                stat = get_box_score_for_player(game["game_id"], pick.player_id)
+                if game["game_id"] not in box_by_game:
+                    box_by_game[game["game_id"]] = get_box_map(game["game_id"])
+                stat = box_by_game[game["game_id"]].get(pick.player_id)
                 if stat:
                     pick.game_id = game["game_id"]
                     actual = stat
@@ -736,7 +743,7 @@ def score_day(code: str, date: str, db: Session = Depends(get_db)):
         db.commit()
         db.refresh(result)
         results.append(
-            PickResultOut(
+            PickResultOut.model_construct(
                 pick_id=pick.id, score=result.score, breakdown=result.breakdown_json
             )
         )
@@ -752,7 +759,7 @@ def score_day(code: str, date: str, db: Session = Depends(get_db)):
     )
     return LeaderboardResponse(
         leaderboard=[
-            LeaderboardRow(user_id=row[0], user_name=row[1], score=row[2])
+            LeaderboardRow.model_construct(user_id=row[0], user_name=row[1], score=float(row[2]))
             for row in leaderboard
         ],
         picks_with_results=results,
@@ -774,7 +781,11 @@ def leaderboard(code: str, date: str, db: Session = Depends(get_db)):
         .order_by(func.sum(PickResult.score).desc())
         .all()
     )
-    return [LeaderboardRow(user_id=row[0], user_name=row[1], score=row[2]) for row in rows]
+    # Rows come straight from our own aggregate query; skip re-validation.
+    return [
+        LeaderboardRow.model_construct(user_id=row[0], user_name=row[1], score=float(row[2]))
+        for row in rows
+    ]
 
 
 @app.get("/api/groups/{code}/leaderboard/alltime", response_model=List[LeaderboardRow])
@@ -791,7 +802,11 @@ def leaderboard_all_time(code: str, db: Session = Depends(get_db)):
         .order_by(func.sum(PickResult.score).desc())
         .all()
     )
-    return [LeaderboardRow(user_id=row[0], user_name=row[1], score=row[2]) for row in rows]
+    # Rows come straight from our own aggregate query; skip re-validation.
+    return [
+        LeaderboardRow.model_construct(user_id=row[0], user_name=row[1], score=float(row[2]))
+        for row in rows
+    ]
 
 
 # --- Frontend static serving (for Docker/Render) ---
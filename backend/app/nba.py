@@ -1,35 +1,73 @@
 from __future__ import annotations
 
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Dict, List
+from operator import itemgetter
+from typing import Dict, List, Tuple
 
 import requests
 from nba_api.stats.endpoints import BoxScoreTraditionalV2, PlayerGameLog, ScoreboardV2
 from nba_api.stats.static import players as nba_players
 
-def _nba_headers() -> dict:
-    """
-    stats.nba.com often blocks non-browser clients (common on Render).
-    Instead of relying on NBAStatsHTTP internals (which vary across nba_api versions),
-    we pass headers directly into each endpoint call.
-    """
-    user_agent = os.getenv(
+# Fixed column offsets into BoxScoreTraditionalV2.player_stats rows.
+_PLAYER_ROW_KEYS = ("player_id", "player_name", "team")
+_PLAYER_ROW_GET = itemgetter(4, 5, 7)
+_BOX_ROW_KEYS = (
+    "points",
+    "assists",
+    "rebounds",
+    "steals",
+    "blocks",
+    "turnovers",
+    "personal_fouls",
+)
+# Stat columns in _BOX_ROW_KEYS order, followed by MIN.
+_BOX_ROW_GET = itemgetter(26, 21, 20, 22, 23, 24, 25, 9)
+
+# game_id -> (fetched_at monotonic, player_stats rows). Short TTL: games may be live.
+_BOX_ROWS_CACHE: Dict[str, Tuple[float, List[list]]] = {}
+_BOX_ROWS_TTL_SECONDS = 60
+# Sync routes run in FastAPI's threadpool; guards every read, sweep and insert.
+_BOX_ROWS_LOCK = threading.Lock()
+
+
+# stats.nba.com often blocks non-browser clients (common on Render).
+# Instead of relying on NBAStatsHTTP internals (which vary across nba_api versions),
+# we pass headers directly into each endpoint call. Built once at import; requests
+# never mutates the headers dict it is given, so the same instance is shared.
+_NBA_HEADERS = {
+    "User-Agent": os.getenv(
         "NBA_API_USER_AGENT",
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
         "AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/120.0.0.0 Safari/537.36",
-    )
-    return {
-        "User-Agent": user_agent,
-        "Accept": "application/json, text/plain, */*",
-        "Accept-Language": "en-US,en;q=0.9",
-        "Origin": "https://stats.nba.com",
-        "Referer": "https://stats.nba.com/",
-        "Connection": "keep-alive",
-        "x-nba-stats-origin": "stats",
-        "x-nba-stats-token": "true",
-    }
+    ),
+    "Accept": "application/json, text/plain, */*",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Origin": "https://stats.nba.com",
+    "Referer": "https://stats.nba.com/",
+    "Connection": "keep-alive",
+    "x-nba-stats-origin": "stats",
+    "x-nba-stats-token": "true",
+}
+
+
+# Shared by every schedule lookup so requests don't pay thread start-up each time.
+_SCHEDULE_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="schedule")
+
+
+def _espn_hedge_delay_seconds() -> float:
+    try:
+        return max(0.0, float(os.getenv("ESPN_HEDGE_DELAY", "1.5")))
+    except Exception:
+        return 1.5
+
+
+def _nba_headers() -> dict:
+    return _NBA_HEADERS
 
 
 def _nba_timeout_seconds() -> int:
@@ -108,21 +146,16 @@ def _get_games_by_date_espn(date_str: str) -> List[Dict[str, str]]:
     return results
 
 
-def get_games_by_date(date_str: str) -> List[Dict[str, str]]:
-    scoreboard_date = _normalize_scoreboard_date(date_str)
-    try:
-        scoreboard = ScoreboardV2(
-            game_date=scoreboard_date,
-            league_id="00",
-            day_offset=0,
-            headers=_nba_headers(),
-            timeout=_nba_timeout_seconds(),
-        )
-        games = scoreboard.game_header.get_dict()["data"]
-        teams = scoreboard.line_score.get_dict()["data"]
-    except Exception:
-        # Primary provider failed; try ESPN fallback.
-        return _get_games_by_date_espn(date_str)
+def _get_games_by_date_nba_api(scoreboard_date: str) -> List[Dict[str, str]]:
+    scoreboard = ScoreboardV2(
+        game_date=scoreboard_date,
+        league_id="00",
+        day_offset=0,
+        headers=_nba_headers(),
+        timeout=_nba_timeout_seconds(),
+    )
+    games = scoreboard.game_header.get_dict()["data"]
+    teams = scoreboard.line_score.get_dict()["data"]
 
     team_map = {}
     for team in teams:
@@ -146,56 +179,85 @@ def get_games_by_date(date_str: str) -> List[Dict[str, str]]:
                 "start_time": start_time,
             }
         )
-    # If nba_api returns empty unexpectedly, try ESPN as a fallback.
-    if not results:
-        try:
-            espn = _get_games_by_date_espn(date_str)
-            return espn or results
-        except Exception:
-            return results
     return results
 
 
-def get_players_for_game(game_id: str) -> List[Dict[str, str]]:
-    box = BoxScoreTraditionalV2(
-        game_id=game_id,
-        headers=_nba_headers(),
-        timeout=_nba_timeout_seconds(),
-    )
-    players = box.player_stats.get_dict()["data"]
-    results = []
-    for row in players:
-        results.append(
-            {
-                "player_id": row[4],
-                "player_name": row[5],
-                "team": row[7],
-                "game_id": game_id,
-            }
-        )
-    return results
+def get_games_by_date(date_str: str) -> List[Dict[str, str]]:
+    """
+    Hedged schedule lookup: nba_api goes first, and the ESPN fallback is only sent
+    if nba_api has not answered within ESPN_HEDGE_DELAY seconds (or fails / comes
+    back empty), so a slow/blocked stats.nba.com doesn't add its full latency in
+    front of the fallback while healthy lookups make a single upstream call.
+    nba_api results still win when available because downstream box-score
+    lookups need NBA Stats game ids.
+    """
+    scoreboard_date = _normalize_scoreboard_date(date_str)
+    primary = _SCHEDULE_POOL.submit(_get_games_by_date_nba_api, scoreboard_date)
+    fallback = None
+    if wait([primary], timeout=_espn_hedge_delay_seconds()).not_done:
+        fallback = _SCHEDULE_POOL.submit(_get_games_by_date_espn, date_str)
+
+    def espn() -> List[Dict[str, str]]:
+        return fallback.result() if fallback is not None else _get_games_by_date_espn(date_str)
+
+    try:
+        results = primary.result()
+    except Exception:
+        # Primary provider failed; use ESPN fallback (already in flight if hedged).
+        return espn()
+    if results:
+        if fallback is not None:
+            fallback.cancel()
+        return results
+    # If nba_api returns empty unexpectedly, try ESPN as a fallback.
+    try:
+        return espn() or results
+    except Exception:
+        return results
 
 
-def get_box_score_for_player(game_id: str, player_id: int) -> Dict[str, float] | None:
+def _box_rows(game_id: str) -> List[list]:
+    """
+    Raw BoxScoreTraditionalV2 player_stats rows, cached briefly per game so that
+    players + per-player stats for one game share a single HTTP call and parse.
+    """
+    now = time.monotonic()
+    with _BOX_ROWS_LOCK:
+        cached = _BOX_ROWS_CACHE.get(game_id)
+    if cached and now - cached[0] < _BOX_ROWS_TTL_SECONDS:
+        return cached[1]
     box = BoxScoreTraditionalV2(
         game_id=game_id,
         headers=_nba_headers(),
         timeout=_nba_timeout_seconds(),
     )
-    players = box.player_stats.get_dict()["data"]
-    for row in players:
-        if row[4] == player_id:
-            return {
-                "points": float(row[26] or 0),
-                "assists": float(row[21] or 0),
-                "rebounds": float(row[20] or 0),
-                "steals": float(row[22] or 0),
-                "blocks": float(row[23] or 0),
-                "turnovers": float(row[24] or 0),
-                "personal_fouls": float(row[25] or 0),
-                "minutes": row[9],
-            }
-    return None
+    rows = box.player_stats.get_dict()["data"]
+    with _BOX_ROWS_LOCK:
+        for stale in [k for k, (ts, _) in _BOX_ROWS_CACHE.items() if now - ts >= _BOX_ROWS_TTL_SECONDS]:
+            del _BOX_ROWS_CACHE[stale]
+        _BOX_ROWS_CACHE[game_id] = (now, rows)
+    return rows
+
+
+def _box_stats(row: list) -> Dict[str, float]:
+    *values, minutes = _BOX_ROW_GET(row)
+    stats = {k: float(v or 0) for k, v in zip(_BOX_ROW_KEYS, values)}
+    stats["minutes"] = minutes
+    return stats
+
+
+def get_box_map(game_id: str) -> Dict[int, Dict[str, float]]:
+    """
+    Box score stats for every player in a game, keyed by player_id, from one response.
+    """
+    return {row[4]: _box_stats(row) for row in _box_rows(game_id)}
+
+
+def get_players_for_game(game_id: str) -> List[Dict[str, str]]:
+    return [
+        dict(zip(_PLAYER_ROW_KEYS, _PLAYER_ROW_GET(row)), game_id=game_id)
+        for row in _box_rows(game_id)
+    ]
 
 
 def get_recent_games(player_id: int, end_date: str, n_games: int) -> List[Dict[str, float]]:
@@ -207,8 +269,11 @@ def get_recent_games(player_id: int, end_date: str, n_games: int) -> List[Dict[s
         timeout=_nba_timeout_seconds(),
     )
     games = log.get_dict()["resultSets"][0]["rowSet"]
+    # Rows come back newest first and date_to_nullable already bounds them, so only
+    # the head of the log can matter; the small margin covers same-day rows we skip.
+    candidate_rows = games[: n_games + 5]
     results = []
-    for row in games:
+    for row in candidate_rows:
         game_date = datetime.strptime(row[3], "%b %d, %Y")
         if game_date.strftime("%Y-%m-%d") >= end_date:
             continue
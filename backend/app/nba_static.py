@@ -1,23 +1,42 @@
 from __future__ import annotations
 
+import os
+import pickle
 import re
+import stat
+import tempfile
 import unicodedata
 from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, version
 from typing import Any, Dict, List, Optional
 
 from nba_api.stats.static import players as nba_players
 
 
-_SUFFIXES = {"jr", "sr", "ii", "iii", "iv", "v"}
+_SUFFIXES = frozenset({"jr", "sr", "ii", "iii", "iv", "v"})
 _NON_WORD_RE = re.compile(r"[^\w\s]", re.UNICODE)
 _SPACE_RE = re.compile(r"\s+")
 
+# Bump when _normalize_name output changes so stale on-disk indexes are rebuilt.
+_INDEX_FORMAT = 2
+# Per-user directory so other local users cannot plant a pickle where we load it.
+_INDEX_CACHE_PATH = os.getenv("NBA_PLAYER_INDEX_CACHE") or os.path.join(
+    tempfile.gettempdir(), f"nba-players-{os.getuid()}", "players_index.pkl"
+)
+
 
 def _strip_accents(s: str) -> str:
     # e.g., "Bojan Bogdanović" -> "Bojan Bogdanovic"
-    return "".join(
-        ch for ch in unicodedata.normalize("NFKD", s) if not unicodedata.combining(ch)
-    )
+    if s.isascii():
+        # ASCII is already NFKD with nothing to strip (most names).
+        return s
+    decomposed = s if unicodedata.is_normalized("NFKD", s) else unicodedata.normalize("NFKD", s)
+    # Fast path: drop combining marks (and any other non-ASCII) in one C-level pass.
+    stripped = decomposed.encode("ascii", "ignore").decode("ascii")
+    if stripped or not decomposed:
+        return stripped
+    # Entirely non-ASCII names: keep the letters, only drop combining marks.
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
 
 
 def _normalize_name(full_name: str) -> str:
@@ -37,21 +56,80 @@ def _normalize_name(full_name: str) -> str:
     return " ".join(parts)
 
 
+def _index_cache_key() -> str:
+    try:
+        nba_api_version = version("nba_api")
+    except PackageNotFoundError:
+        nba_api_version = "unknown"
+    return f"{nba_api_version}:{_INDEX_FORMAT}"
+
+
+def _owned_privately(st: os.stat_result) -> bool:
+    # Unpickling runs code, so only trust paths we own that nobody else can write.
+    return st.st_uid == os.getuid() and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def _is_private(path: str) -> bool:
+    try:
+        return _owned_privately(os.stat(path))
+    except OSError:
+        return False
+
+
+def _load_index_cache(key: str) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+    if not _is_private(os.path.dirname(_INDEX_CACHE_PATH)):
+        return None
+    try:
+        with open(_INDEX_CACHE_PATH, "rb") as f:
+            if not _owned_privately(os.fstat(f.fileno())):
+                return None
+            cached_key, idx = pickle.load(f)
+    except Exception:
+        return None
+    if cached_key != key or not isinstance(idx, dict):
+        return None
+    return idx
+
+
+def _save_index_cache(key: str, idx: Dict[str, List[Dict[str, Any]]]) -> None:
+    # Best-effort: write to a temp file then rename so concurrent workers never
+    # read a partial pickle.
+    try:
+        cache_dir = os.path.dirname(_INDEX_CACHE_PATH)
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        if not _is_private(cache_dir):
+            return
+        tmp_path = f"{_INDEX_CACHE_PATH}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((key, idx), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, _INDEX_CACHE_PATH)
+    except Exception:
+        return
+
+
 @lru_cache(maxsize=1)
 def _player_index() -> Dict[str, List[Dict[str, Any]]]:
     """
     Map normalized full_name -> list of nba_api player dicts.
     We keep a list because duplicates exist (e.g., "Gary Payton").
+    Persisted to disk (keyed by nba_api version) so restarts skip the rebuild.
     """
+    key = _index_cache_key()
+    cached = _load_index_cache(key)
+    if cached is not None:
+        return cached
+
     idx: Dict[str, List[Dict[str, Any]]] = {}
     for p in nba_players.get_players() or []:
         if not isinstance(p, dict):
             continue
         full = str(p.get("full_name") or "").strip()
-        key = _normalize_name(full)
-        if not key:
+        key_name = _normalize_name(full)
+        if not key_name:
             continue
-        idx.setdefault(key, []).append(p)
+        idx.setdefault(key_name, []).append(p)
+    _save_index_cache(key, idx)
     return idx
 
 
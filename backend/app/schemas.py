@@ -4,6 +4,11 @@ from typing import Any, Dict, List
 from pydantic import BaseModel, ConfigDict
 
 
+class ReadOnlyModel(BaseModel):
+    # Response models are built once and never mutated; subclasses inherit this config.
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+
 class GroupCreate(BaseModel):
     group_name: str
     display_name: str
@@ -14,45 +19,45 @@ class GroupJoin(BaseModel):
     display_name: str
 
 
-class GroupOut(BaseModel):
+class GroupOut(ReadOnlyModel):
     model_config = ConfigDict(from_attributes=True)
     id: int
     name: str
     code: str
 
 
-class UserOut(BaseModel):
+class UserOut(ReadOnlyModel):
     model_config = ConfigDict(from_attributes=True)
     id: int
     display_name: str
 
 
-class GroupResponse(BaseModel):
+class GroupResponse(ReadOnlyModel):
     group: GroupOut
     user: UserOut
 
 
-class GroupMemberOut(BaseModel):
+class GroupMemberOut(ReadOnlyModel):
     id: int
     display_name: str
     joined_at: datetime
 
 
-class GameOut(BaseModel):
+class GameOut(ReadOnlyModel):
     game_id: str
     home_team: str
     away_team: str
     start_time: str
 
 
-class PlayerOut(BaseModel):
+class PlayerOut(ReadOnlyModel):
     player_id: int
     player_name: str
     team: str
     game_id: str
 
 
-class RosterPlayerOut(BaseModel):
+class RosterPlayerOut(ReadOnlyModel):
     # NBA Stats player_id when we can map it from name; may be null for unknowns.
     player_id: int | None = None
     player_name: str
@@ -60,14 +65,14 @@ class RosterPlayerOut(BaseModel):
     jersey: str | None = None
 
 
-class TeamRosterOut(BaseModel):
+class TeamRosterOut(ReadOnlyModel):
     team_id: str
     team_name: str
     team_abbr: str
     players: List[RosterPlayerOut]
 
 
-class GameRostersResponse(BaseModel):
+class GameRostersResponse(ReadOnlyModel):
     game_id: str
     date: date
     source: str
@@ -76,7 +81,7 @@ class GameRostersResponse(BaseModel):
     away: TeamRosterOut
 
 
-class RecentGamesProjectionOut(BaseModel):
+class RecentGamesProjectionOut(ReadOnlyModel):
     n_games_used: int
     points: float
     assists: float
@@ -87,13 +92,13 @@ class RecentGamesProjectionOut(BaseModel):
     personal_fouls: float
 
 
-class SportsbookLinesOut(BaseModel):
+class SportsbookLinesOut(ReadOnlyModel):
     provider: str
     last_updated: datetime
     lines: Dict[str, float]
 
 
-class PlayerProjectionResponse(BaseModel):
+class PlayerProjectionResponse(ReadOnlyModel):
     player_id: int
     player_name: str
     date: date
@@ -112,7 +117,7 @@ class PickCreate(BaseModel):
     player_name: str
 
 
-class PickWithUser(BaseModel):
+class PickWithUser(ReadOnlyModel):
     id: int
     user_id: int
     user_name: str
@@ -120,18 +125,18 @@ class PickWithUser(BaseModel):
     status: str
 
 
-class PickResultOut(BaseModel):
+class PickResultOut(ReadOnlyModel):
     pick_id: int
     score: float
     breakdown: Dict[str, Any]
 
 
-class LeaderboardRow(BaseModel):
+class LeaderboardRow(ReadOnlyModel):
     user_id: int
     user_name: str
     score: float
 
 
-class LeaderboardResponse(BaseModel):
+class LeaderboardResponse(ReadOnlyModel):
     leaderboard: List[LeaderboardRow]
     picks_with_results: List[PickResultOut]
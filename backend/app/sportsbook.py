@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import os
-import re
 import unicodedata
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Dict, Iterable, Optional, Tuple
 
+import ijson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 @dataclass(frozen=True)
@@ -17,6 +20,24 @@ class SportsbookResult:
     lines: Dict[str, float]
 
 
+def _build_session() -> requests.Session:
+    # One pooled keep-alive session for all provider calls (one call per player
+    # adds up); repeat requests skip the TCP + TLS handshake.
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.1),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Accept-Encoding"] = "gzip, deflate"
+    return session
+
+
+_SESSION = _build_session()
+
+
 class SportsbookProvider:
     provider_name: str
 
@@ -26,43 +47,74 @@ class SportsbookProvider:
         raise NotImplementedError
 
 
-_SUFFIXES = {"jr", "sr", "ii", "iii", "iv", "v"}
-_NON_WORD_RE = re.compile(r"[^\w\s]", re.UNICODE)
-_SPACE_RE = re.compile(r"\s+")
+_SUFFIXES = frozenset({"jr", "sr", "ii", "iii", "iv", "v"})
+
+
+class _NonWordTable(dict):
+    """
+    str.translate table mapping every char that is neither a word char (alnum or
+    "_") nor whitespace to a space. Filled lazily per code point so it covers all
+    of Unicode without building a huge table at import.
+    """
+
+    def __missing__(self, cp: int) -> int | str:
+        ch = chr(cp)
+        value: int | str = cp if ch.isalnum() or ch == "_" or ch.isspace() else " "
+        self[cp] = value
+        return value
+
+
+_NON_WORD_TABLE = _NonWordTable()
 
 
 def _strip_accents(s: str) -> str:
-    return "".join(
-        ch for ch in unicodedata.normalize("NFKD", s) if not unicodedata.combining(ch)
-    )
+    if s.isascii():
+        # ASCII is already NFKD with nothing to strip (most labels).
+        return s
+    if not unicodedata.is_normalized("NFKD", s):
+        s = unicodedata.normalize("NFKD", s)
+    return "".join(ch for ch in s if not unicodedata.combining(ch))
 
 
 def _normalize_name(name: str) -> str:
     s = _strip_accents((name or "").strip()).lower()
-    s = _NON_WORD_RE.sub(" ", s)
-    s = _SPACE_RE.sub(" ", s).strip()
-    if not s:
+    # Drop punctuation, then split() both collapses whitespace runs and trims.
+    parts = s.translate(_NON_WORD_TABLE).split()
+    if not parts:
         return ""
-    parts = s.split(" ")
     while parts and parts[-1] in _SUFFIXES:
         parts = parts[:-1]
     return " ".join(parts)
 
 
-def _name_match(haystack: str, needle: str) -> bool:
+@lru_cache(maxsize=4096)
+def _normalize_name_cached(name: str) -> str:
+    # Outcome labels repeat heavily across markets/books within a feed.
+    return _normalize_name(name)
+
+
+def _name_match_pre(haystack: str, n: str, nt: list[str]) -> bool:
     """
-    Best-effort player name match.
+    Best-effort player name match against an outcome label.
     - Substring match on normalized names
     - Token-based fallback: last name must match + first initial match if present
+    The needle comes already normalized (`n`) and split (`nt`), so hot loops
+    normalize the player name once instead of once per outcome.
     """
-    h = _normalize_name(haystack)
-    n = _normalize_name(needle)
-    if not h or not n:
+    if not n:
+        return False
+    # Fast reject (most outcomes are other players): normalizing an ASCII label
+    # only lowercases it and turns punctuation into spaces, so a label naming this
+    # player must contain the last name verbatim.
+    last = nt[-1]
+    if haystack.isascii() and last.isascii() and last not in haystack.lower():
+        return False
+    h = _normalize_name_cached(haystack)
+    if not h:
         return False
     if n in h or h in n:
         return True
     ht = h.split(" ")
-    nt = n.split(" ")
     if len(nt) >= 2 and len(ht) >= 2:
         # last-name match
         if ht[-1] != nt[-1]:
@@ -72,30 +124,73 @@ def _name_match(haystack: str, needle: str) -> bool:
     return False
 
 
-def _iter_dicts(node: Any) -> Iterable[Dict[str, Any]]:
-    """
-    Yield all dict nodes in a JSON-like structure (dict/list scalars).
-    """
-    if isinstance(node, dict):
-        yield node
-        for v in node.values():
-            yield from _iter_dicts(v)
-    elif isinstance(node, list):
-        for v in node:
-            yield from _iter_dicts(v)
+# Stands in for nested containers the streaming scan doesn't keep.
+_NESTED = object()
 
 
+def _iter_dicts_streaming(stream: Any) -> Iterable[Dict[str, Any]]:
+    """
+    Incrementally parse a JSON byte stream and yield every object as it closes.
+    Yielded dicts are shallow: scalar fields are kept as-is and nested containers
+    are replaced by a placeholder with the same truthiness, except an "outcomes"
+    array, which is kept as a list of (shallow) items. That is everything the
+    DraftKings scan reads, so the full feed is never materialized and the caller
+    can stop reading as soon as it has what it needs.
+    Objects are yielded when they close (children before parents); for the usual
+    market -> outcomes layout that is still document order between markets.
+    """
+    # Frames: [container, current_key, non_empty]. container is a dict, a list we
+    # are collecting, or None for arrays whose items we don't keep.
+    stack: list = []
+    for _, event, value in ijson.parse(stream, use_float=True):
+        if event == "map_key":
+            stack[-1][1] = value
+            continue
+        if event == "end_map" or event == "end_array":
+            node, _, non_empty = stack.pop()
+            parent, key, _ = stack[-1] if stack else (None, None, None)
+            # Don't keep finished subtrees alive through their parent object
+            # (collected "outcomes" lists stay; they are read from the parent).
+            if type(parent) is dict and not (event == "end_array" and node is not None):
+                parent[key] = _NESTED if non_empty else ([] if event == "end_array" else {})
+            if event == "end_map":
+                yield node
+            continue
+
+        if event == "start_map":
+            node = {}
+        elif event == "start_array":
+            keep = bool(stack) and type(stack[-1][0]) is dict and stack[-1][1] == "outcomes"
+            node = [] if keep else None
+        else:
+            node = value
+        if stack:
+            frame = stack[-1]
+            frame[2] = True
+            parent = frame[0]
+            if type(parent) is dict:
+                parent[frame[1]] = node
+            elif parent is not None:
+                parent.append(_NESTED if node is None and event == "start_array" else node)
+        if event == "start_map" or event == "start_array":
+            stack.append([node, None, False])
+
+
+# Combo markets (we only want single stat lines for now); cheapest/most common first.
+_COMBO_MARKERS = ("pra", "points+rebounds+assists", "points rebounds assists")
+# Single-stat keywords in match priority order.
+_STAT_KEYWORDS = ("points", "rebounds", "assists")
+
+
+@lru_cache(maxsize=1024)
 def _stat_from_label(label: str) -> str | None:
+    # Cached: a feed repeats the same handful of market labels many times.
     s = (label or "").lower()
-    # Avoid combos (we only want single stat lines for now)
-    if "points+rebounds+assists" in s or "points rebounds assists" in s or "pra" in s:
+    if any(m in s for m in _COMBO_MARKERS):
         return None
-    if "points" in s:
-        return "points"
-    if "rebounds" in s:
-        return "rebounds"
-    if "assists" in s:
-        return "assists"
+    for stat in _STAT_KEYWORDS:
+        if stat in s:
+            return stat
     return None
 
 
@@ -157,46 +252,54 @@ class DraftKingsProvider(SportsbookProvider):
     def get_player_lines(
         self, *, player_id: int, player_name: str, date_str: str, game_id: str | None
     ) -> Optional[SportsbookResult]:
-        resp = requests.get(self.json_url, timeout=10)
-        resp.raise_for_status()
-        data = resp.json()
-
         wanted = _normalize_name(player_name)
         if not wanted:
             return None
+        wanted_tokens = wanted.split(" ")
 
-        lines: Dict[str, float] = {}
+        resp = _SESSION.get(self.json_url, timeout=10, stream=True)
+        resp.raise_for_status()
+        # Let urllib3 undo gzip/deflate so ijson sees plain JSON bytes.
+        resp.raw.decode_content = True
 
-        # Pass 1: try market containers with outcomes lists.
-        for d in _iter_dicts(data):
-            maybe = _extract_market_outcomes(d)
-            if not maybe:
-                continue
-            market_label, outcomes = maybe
-            stat = _stat_from_label(market_label)
-            if not stat or stat in lines:
-                continue
-            for outcome in outcomes:
-                pl, ln = _extract_outcome_line(outcome)
-                if ln is None or not pl:
+        lines: Dict[str, float] = {}
+        # Loose outcome matches only fill stats no market container provided.
+        fallback: Dict[str, float] = {}
+
+        # Single streaming walk over the feed; each dict is tried both as a market
+        # container with an outcomes list and as a standalone outcome mentioning a stat.
+        with resp:
+            for d in _iter_dicts_streaming(resp.raw):
+                maybe = _extract_market_outcomes(d)
+                if maybe:
+                    market_label, outcomes = maybe
+                    stat = _stat_from_label(market_label)
+                    if stat and stat not in lines:
+                        for outcome in outcomes:
+                            pl, ln = _extract_outcome_line(outcome)
+                            if ln is None or not pl:
+                                continue
+                            if _name_match_pre(pl, wanted, wanted_tokens):
+                                lines[stat] = ln
+                                break
+                        if len(lines) == 3:
+                            break
+
+                # Fallback can't add anything once every stat has a candidate.
+                if all(k in lines or k in fallback for k in _STAT_KEYWORDS):
                     continue
-                if _name_match(pl, wanted):
-                    lines[stat] = ln
-                    break
-
-        # Pass 2 (fallback): scan for any outcome-like dicts that mention the player and a stat.
-        if any(k not in lines for k in ("points", "rebounds", "assists")):
-            for d in _iter_dicts(data):
-                # Look for dicts that have a line and some label with stat words.
                 pl, ln = _extract_outcome_line(d)
                 if ln is None or not pl:
                     continue
-                if not _name_match(pl, wanted):
-                    continue
                 label = str(d.get("market") or d.get("label") or d.get("name") or "")
                 stat = _stat_from_label(label)
-                if stat and stat not in lines:
-                    lines[stat] = ln
+                if not stat or stat in fallback or stat in lines:
+                    continue
+                if _name_match_pre(pl, wanted, wanted_tokens):
+                    fallback[stat] = ln
+
+        for stat, ln in fallback.items():
+            lines.setdefault(stat, ln)
 
         if not lines:
             return None
@@ -208,6 +311,20 @@ class DraftKingsProvider(SportsbookProvider):
         )
 
 
+_ODDS_API_MARKET_STATS = {
+    "player_points": "points",
+    "player_rebounds": "rebounds",
+    "player_assists": "assists",
+}
+
+# Bookmakers to prefer when an event lists several (read once at import).
+_PREFERRED_BOOKS = frozenset(
+    b.strip().lower()
+    for b in (os.getenv("ODDS_API_BOOKMAKERS") or "draftkings,fanduel").split(",")
+    if b.strip()
+)
+
+
 class OddsApiProvider(SportsbookProvider):
     """
     Optional integration with The Odds API (https://the-odds-api.com/).
@@ -236,7 +353,7 @@ class OddsApiProvider(SportsbookProvider):
             "oddsFormat": "american",
         }
         url = f"{base}/sports/basketball_nba/odds"
-        resp = requests.get(url, params=params, timeout=10)
+        resp = _SESSION.get(url, params=params, timeout=10)
         resp.raise_for_status()
         events = resp.json()
 
@@ -245,12 +362,7 @@ class OddsApiProvider(SportsbookProvider):
         wanted = _normalize_name(player_name)
         if not wanted:
             return None
-
-        preferred_books = [
-            b.strip().lower()
-            for b in (os.getenv("ODDS_API_BOOKMAKERS") or "draftkings,fanduel").split(",")
-            if b.strip()
-        ]
+        wanted_tokens = wanted.split(" ")
 
         def _maybe_set(key: str, value: Any) -> None:
             try:
@@ -264,15 +376,19 @@ class OddsApiProvider(SportsbookProvider):
             bookmakers = event.get("bookmakers") if isinstance(event, dict) else None
             books = [b for b in bookmakers if isinstance(bookmakers, list) and isinstance(b, dict)]
             # Prefer a specific bookmaker if available (improves consistency).
-            if preferred_books:
-                preferred = [b for b in books if str(b.get("key") or "").lower() in preferred_books]
+            if _PREFERRED_BOOKS:
+                preferred = [b for b in books if str(b.get("key") or "").lower() in _PREFERRED_BOOKS]
                 books = preferred or books
 
             for book in books:
                 markets = book.get("markets") if isinstance(book, dict) else None
                 for market in markets if isinstance(markets, list) else []:
-                    market_key = market.get("key")
-                    outcomes = market.get("outcomes") if isinstance(market, dict) else None
+                    if not isinstance(market, dict):
+                        continue
+                    stat = _ODDS_API_MARKET_STATS.get(market.get("key"))
+                    if stat is None:
+                        continue
+                    outcomes = market.get("outcomes")
                     for outcome in outcomes if isinstance(outcomes, list) else []:
                         # For player props, Odds API commonly uses:
                         # - outcome["name"] == "Over"/"Under"
@@ -284,22 +400,12 @@ class OddsApiProvider(SportsbookProvider):
                         )
                         if not isinstance(candidate, str) or not candidate.strip():
                             continue
-                        if not _name_match(candidate, wanted):
+                        if not _name_match_pre(candidate, wanted, wanted_tokens):
                             continue
                         # The "point" value is the line for many props.
-                        point = outcome.get("point")
-                        if market_key == "player_points":
-                            _maybe_set("points", point)
-                        elif market_key == "player_rebounds":
-                            _maybe_set("rebounds", point)
-                        elif market_key == "player_assists":
-                            _maybe_set("assists", point)
-                        # Stop early if we found all three.
-                        if (
-                            "points" in lines
-                            and "rebounds" in lines
-                            and "assists" in lines
-                        ):
+                        _maybe_set(stat, outcome.get("point"))
+                        # Stop early if we found all three (only these keys are ever set).
+                        if len(lines) == 3:
                             return SportsbookResult(
                                 provider=self.provider_name,
                                 last_updated=datetime.now(timezone.utc),
@@ -3,9 +3,8 @@ Database configuration and session management for the NBA application.
 """
 
 import os
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker, Session, declarative_base
-from sqlalchemy.pool import StaticPool
 from typing import Generator
 import logging
 
@@ -22,9 +21,10 @@ DATABASE_URL = os.getenv(
 SQLALCHEMY_KWARGS = {}
 if DATABASE_URL.startswith("sqlite"):
     # SQLite specific configuration
+    # Default pool (one connection per thread) so requests don't serialize on
+    # a single shared connection; WAL below keeps readers and writers apart.
     SQLALCHEMY_KWARGS = {
         "connect_args": {"check_same_thread": False},
-        "poolclass": StaticPool,
     }
 else:
     # PostgreSQL or other databases
@@ -123,13 +123,17 @@ def get_session_factory():
     return SessionLocal
 
 
-# Add event listeners for connection pool management (non-SQLite databases)
-if not DATABASE_URL.startswith("sqlite"):
+# Tune every new SQLite connection (PRAGMAs are per-connection)
+if DATABASE_URL.startswith("sqlite"):
     @event.listens_for(engine, "connect")
-    def receive_connect(dbapi_conn, connection_record):
-        """Enable foreign keys on connection for PostgreSQL"""
+    def _sqlite_pragmas(dbapi_conn, connection_record):
+        """Enable WAL and larger in-memory caches on SQLite connections"""
         cursor = dbapi_conn.cursor()
-        cursor.execute("SET foreign_key_checks=1")
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+        cursor.execute("PRAGMA cache_size=-65536")    # 64 MiB
         cursor.close()
 
 
@@ -143,8 +147,7 @@ def check_db_connection() -> bool:
     """
     try:
         with engine.connect() as connection:
-            connection.execute("SELECT 1")
-        logger.info("Database connection is healthy")
+            connection.execute(text("SELECT 1")).scalar()
         return True
     except Exception as e:
         logger.error(f"Database connection error: {str(e)}")
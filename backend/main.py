@@ -1,14 +1,17 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from typing import List, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
 import uvicorn
 
 # Initialize FastAPI app
 app = FastAPI(
     title="NBA API",
     description="A FastAPI application for NBA data and analytics",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS middleware
@@ -48,10 +51,50 @@ class Game(BaseModel):
     away_score: int
 
 
-# In-memory data storage (replace with database in production)
-players_db: List[Player] = []
-teams_db: List[Team] = []
-games_db: List[Game] = []
+# Storage rows: request bodies are validated once on the way in, then kept as
+# plain slotted dataclasses that orjson can serialize without Pydantic.
+@dataclass(slots=True)
+class PlayerRow:
+    id: int
+    name: str
+    team: str
+    position: str
+    number: int
+
+
+@dataclass(slots=True)
+class TeamRow:
+    id: int
+    name: str
+    city: str
+    conference: str
+    wins: int
+    losses: int
+
+
+@dataclass(slots=True)
+class GameRow:
+    id: int
+    date: str
+    home_team: str
+    away_team: str
+    home_score: int
+    away_score: int
+
+
+# In-memory data storage (replace with database in production), keyed by id
+players_db: Dict[int, PlayerRow] = {}
+teams_db: Dict[int, TeamRow] = {}
+games_db: Dict[int, GameRow] = {}
+
+
+def _replace(store: Dict[int, Any], item_id: int, row: Any, label: str) -> None:
+    """Replace the entry at item_id with row, re-keying if the body changes the id."""
+    if row.id != item_id:
+        if row.id in store:
+            raise HTTPException(status_code=409, detail=f"{label} already exists")
+        del store[item_id]
+    store[row.id] = row
 
 
 # Health check endpoint
@@ -62,132 +105,129 @@ async def health_check():
 
 
 # Player Endpoints
-@app.get("/players", response_model=List[Player])
+@app.get("/players", response_model=None, responses={200: {"model": List[Player]}})
 async def get_players():
     """Get all players"""
-    return players_db
+    return ORJSONResponse(list(players_db.values()))
 
 
 @app.get("/players/{player_id}", response_model=Player)
 async def get_player(player_id: int):
     """Get a specific player by ID"""
-    for player in players_db:
-        if player.id == player_id:
-            return player
-    raise HTTPException(status_code=404, detail="Player not found")
+    player = players_db.get(player_id)
+    if player is None:
+        raise HTTPException(status_code=404, detail="Player not found")
+    return player
 
 
 @app.post("/players", response_model=Player)
 async def create_player(player: Player):
     """Create a new player"""
-    players_db.append(player)
+    if player.id in players_db:
+        raise HTTPException(status_code=409, detail="Player already exists")
+    players_db[player.id] = PlayerRow(**player.model_dump())
     return player
 
 
 @app.put("/players/{player_id}", response_model=Player)
 async def update_player(player_id: int, player: Player):
     """Update a player"""
-    for i, p in enumerate(players_db):
-        if p.id == player_id:
-            players_db[i] = player
-            return player
-    raise HTTPException(status_code=404, detail="Player not found")
+    if player_id not in players_db:
+        raise HTTPException(status_code=404, detail="Player not found")
+    _replace(players_db, player_id, PlayerRow(**player.model_dump()), "Player")
+    return player
 
 
 @app.delete("/players/{player_id}")
 async def delete_player(player_id: int):
     """Delete a player"""
-    for i, p in enumerate(players_db):
-        if p.id == player_id:
-            players_db.pop(i)
-            return {"message": "Player deleted successfully"}
-    raise HTTPException(status_code=404, detail="Player not found")
+    if players_db.pop(player_id, None) is None:
+        raise HTTPException(status_code=404, detail="Player not found")
+    return {"message": "Player deleted successfully"}
 
 
 # Team Endpoints
-@app.get("/teams", response_model=List[Team])
+@app.get("/teams", response_model=None, responses={200: {"model": List[Team]}})
 async def get_teams():
     """Get all teams"""
-    return teams_db
+    return ORJSONResponse(list(teams_db.values()))
 
 
 @app.get("/teams/{team_id}", response_model=Team)
 async def get_team(team_id: int):
     """Get a specific team by ID"""
-    for team in teams_db:
-        if team.id == team_id:
-            return team
-    raise HTTPException(status_code=404, detail="Team not found")
+    team = teams_db.get(team_id)
+    if team is None:
+        raise HTTPException(status_code=404, detail="Team not found")
+    return team
 
 
 @app.post("/teams", response_model=Team)
 async def create_team(team: Team):
     """Create a new team"""
-    teams_db.append(team)
+    if team.id in teams_db:
+        raise HTTPException(status_code=409, detail="Team already exists")
+    teams_db[team.id] = TeamRow(**team.model_dump())
     return team
 
 
 @app.put("/teams/{team_id}", response_model=Team)
 async def update_team(team_id: int, team: Team):
     """Update a team"""
-    for i, t in enumerate(teams_db):
-        if t.id == team_id:
-            teams_db[i] = team
-            return team
-    raise HTTPException(status_code=404, detail="Team not found")
+    if team_id not in teams_db:
+        raise HTTPException(status_code=404, detail="Team not found")
+    _replace(teams_db, team_id, TeamRow(**team.model_dump()), "Team")
+    return team
 
 
 @app.delete("/teams/{team_id}")
 async def delete_team(team_id: int):
     """Delete a team"""
-    for i, t in enumerate(teams_db):
-        if t.id == team_id:
-            teams_db.pop(i)
-            return {"message": "Team deleted successfully"}
-    raise HTTPException(status_code=404, detail="Team not found")
+    if teams_db.pop(team_id, None) is None:
+        raise HTTPException(status_code=404, detail="Team not found")
+    return {"message": "Team deleted successfully"}
 
 
 # Game Endpoints
-@app.get("/games", response_model=List[Game])
+@app.get("/games", response_model=None, responses={200: {"model": List[Game]}})
 async def get_games():
     """Get all games"""
-    return games_db
+    return ORJSONResponse(list(games_db.values()))
 
 
 @app.get("/games/{game_id}", response_model=Game)
 async def get_game(game_id: int):
     """Get a specific game by ID"""
-    for game in games_db:
-        if game.id == game_id:
-            return game
-    raise HTTPException(status_code=404, detail="Game not found")
+    game = games_db.get(game_id)
+    if game is None:
+        raise HTTPException(status_code=404, detail="Game not found")
+    return game
 
 
 @app.post("/games", response_model=Game)
 async def create_game(game: Game):
     """Create a new game"""
-    games_db.append(game)
+    if game.id in games_db:
+        raise HTTPException(status_code=409, detail="Game already exists")
+    games_db[game.id] = GameRow(**game.model_dump())
     return game
 
 
 @app.put("/games/{game_id}", response_model=Game)
 async def update_game(game_id: int, game: Game):
     """Update a game"""
-    for i, g in enumerate(games_db):
-        if g.id == game_id:
-            games_db[i] = game
-            return game
-    raise HTTPException(status_code=404, detail="Game not found")
+    if game_id not in games_db:
+        raise HTTPException(status_code=404, detail="Game not found")
+    _replace(games_db, game_id, GameRow(**game.model_dump()), "Game")
+    return game
 
 
 @app.delete("/games/{game_id}")
 async def delete_game(game_id: int):
     """Delete a game"""
-    for i, g in enumerate(games_db):
-        if g.id == game_id:
-            games_db.pop(i)
-            return {"message": "Game deleted successfully"}
-    raise HTTPException(status_code=404, detail="Game not found")
+    if games_db.pop(game_id, None) is None:
+        raise HTTPException(status_code=404, detail="Game not found")
+    return {"message": "Game deleted successfully"}
 
 
 # Root endpoint
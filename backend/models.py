@@ -4,16 +4,14 @@ SQLAlchemy ORM models for NBA application.
 This module defines the data models for managing groups, users, picks, and player statistics.
 """
 
-from datetime import datetime
 from sqlalchemy import (
     Column, String, Integer, Float, DateTime, Boolean, ForeignKey, 
-    Text, Enum, Numeric, DECIMAL
+    Text, Enum, Numeric, Index, UniqueConstraint, case, func, literal, select
 )
-from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 import enum
 
-Base = declarative_base()
+from database import Base
 
 
 class Group(Base):
@@ -25,8 +23,8 @@ class Group(Base):
     id = Column(Integer, primary_key=True)
     name = Column(String(255), nullable=False, unique=True)
     description = Column(Text)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     # Relationships
     members = relationship("GroupMember", back_populates="group", cascade="all, delete-orphan")
@@ -47,8 +45,8 @@ class User(Base):
     email = Column(String(255), nullable=False, unique=True)
     password_hash = Column(String(255), nullable=False)
     full_name = Column(String(255))
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     is_active = Column(Boolean, default=True)
     
     # Relationships
@@ -66,9 +64,9 @@ class GroupMember(Base):
     __tablename__ = "group_members"
     
     id = Column(Integer, primary_key=True)
-    group_id = Column(Integer, ForeignKey("groups.id"), nullable=False)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    joined_at = Column(DateTime, default=datetime.utcnow)
+    group_id = Column(Integer, ForeignKey("groups.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    joined_at = Column(DateTime(timezone=True), server_default=func.now())
     role = Column(String(50), default="member")  # e.g., "admin", "member"
     
     # Relationships
@@ -84,18 +82,21 @@ class Pick(Base):
     Represents a user's prediction/pick for a player's performance in a game.
     """
     __tablename__ = "picks"
+    __table_args__ = (
+        Index("ix_pick_player_game", "player_id", "game_id"),
+    )
     
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     group_id = Column(Integer, ForeignKey("groups.id"), nullable=False)
     player_id = Column(Integer, nullable=False)  # NBA player ID
-    game_id = Column(Integer, nullable=False)    # NBA game ID
+    game_id = Column(Integer, nullable=False, index=True)    # NBA game ID
     stat_type = Column(String(50), nullable=False)  # e.g., "points", "rebounds", "assists"
-    predicted_value = Column(DECIMAL(10, 2), nullable=False)
+    predicted_value = Column(Numeric(10, 2, asdecimal=False), nullable=False)
     pick_type = Column(String(20), nullable=False)  # e.g., "over", "under"
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    is_settled = Column(Boolean, default=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    is_settled = Column(Boolean, default=False, index=True)
     
     # Relationships
     user = relationship("User", back_populates="picks")
@@ -106,28 +107,44 @@ class Pick(Base):
         return f"<Pick(id={self.id}, user_id={self.user_id}, player_id={self.player_id}, stat_type='{self.stat_type}')>"
 
 
+# Newest-first listings per group / per user (see paged_picks). Key order matches
+# ORDER BY created_at DESC, id DESC, so pages are read straight off the index with
+# no sort; on PostgreSQL the INCLUDE columns cover the user / settled filters.
+Index(
+    "ix_pick_group_created_id",
+    Pick.group_id, Pick.created_at.desc(), Pick.id.desc(),
+    postgresql_include=["user_id", "is_settled"],
+)
+Index(
+    "ix_pick_user_created_id",
+    Pick.user_id, Pick.created_at.desc(), Pick.id.desc(),
+    postgresql_include=["group_id", "is_settled"],
+)
+
+
 class PlayerGameStat(Base):
     """
     Represents actual game statistics for a player in a specific game.
     """
     __tablename__ = "player_game_stats"
+    __table_args__ = (UniqueConstraint("player_id", "game_id", name="uq_pgs_player_game"),)
     
     id = Column(Integer, primary_key=True)
     player_id = Column(Integer, nullable=False)  # NBA player ID
     game_id = Column(Integer, nullable=False)    # NBA game ID
-    points = Column(DECIMAL(10, 2))
-    rebounds = Column(DECIMAL(10, 2))
-    assists = Column(DECIMAL(10, 2))
-    steals = Column(DECIMAL(10, 2))
-    blocks = Column(DECIMAL(10, 2))
-    turnovers = Column(DECIMAL(10, 2))
-    three_pointers_made = Column(DECIMAL(10, 2))
-    field_goal_percentage = Column(DECIMAL(5, 2))
-    free_throw_percentage = Column(DECIMAL(5, 2))
-    minutes_played = Column(DECIMAL(5, 2))
+    points = Column(Numeric(10, 2, asdecimal=False))
+    rebounds = Column(Numeric(10, 2, asdecimal=False))
+    assists = Column(Numeric(10, 2, asdecimal=False))
+    steals = Column(Numeric(10, 2, asdecimal=False))
+    blocks = Column(Numeric(10, 2, asdecimal=False))
+    turnovers = Column(Numeric(10, 2, asdecimal=False))
+    three_pointers_made = Column(Numeric(10, 2, asdecimal=False))
+    field_goal_percentage = Column(Numeric(5, 2, asdecimal=False))
+    free_throw_percentage = Column(Numeric(5, 2, asdecimal=False))
+    minutes_played = Column(Numeric(5, 2, asdecimal=False))
     game_date = Column(DateTime)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     def __repr__(self):
         return f"<PlayerGameStat(player_id={self.player_id}, game_id={self.game_id}, points={self.points})>"
@@ -138,22 +155,23 @@ class PlayerExpectedStat(Base):
     Represents projected or expected statistics for a player in an upcoming game.
     """
     __tablename__ = "player_expected_stats"
+    __table_args__ = (UniqueConstraint("player_id", "game_id", name="uq_pes_player_game"),)
     
     id = Column(Integer, primary_key=True)
     player_id = Column(Integer, nullable=False)  # NBA player ID
     game_id = Column(Integer, nullable=False)    # NBA game ID
-    expected_points = Column(DECIMAL(10, 2))
-    expected_rebounds = Column(DECIMAL(10, 2))
-    expected_assists = Column(DECIMAL(10, 2))
-    expected_steals = Column(DECIMAL(10, 2))
-    expected_blocks = Column(DECIMAL(10, 2))
-    expected_turnovers = Column(DECIMAL(10, 2))
-    expected_three_pointers = Column(DECIMAL(10, 2))
-    confidence_score = Column(DECIMAL(5, 2))  # 0-100 confidence percentage
+    expected_points = Column(Numeric(10, 2, asdecimal=False))
+    expected_rebounds = Column(Numeric(10, 2, asdecimal=False))
+    expected_assists = Column(Numeric(10, 2, asdecimal=False))
+    expected_steals = Column(Numeric(10, 2, asdecimal=False))
+    expected_blocks = Column(Numeric(10, 2, asdecimal=False))
+    expected_turnovers = Column(Numeric(10, 2, asdecimal=False))
+    expected_three_pointers = Column(Numeric(10, 2, asdecimal=False))
+    confidence_score = Column(Numeric(5, 2, asdecimal=False))  # 0-100 confidence percentage
     projection_source = Column(String(100))    # e.g., "ESPN", "DraftKings", "FanDuel"
     game_date = Column(DateTime)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     def __repr__(self):
         return f"<PlayerExpectedStat(player_id={self.player_id}, game_id={self.game_id}, expected_points={self.expected_points})>"
@@ -167,15 +185,162 @@ class PickResult(Base):
     
     id = Column(Integer, primary_key=True)
     pick_id = Column(Integer, ForeignKey("picks.id"), nullable=False, unique=True)
-    actual_value = Column(DECIMAL(10, 2), nullable=False)
+    actual_value = Column(Numeric(10, 2, asdecimal=False), nullable=False)
     is_winner = Column(Boolean, nullable=False)
     points_earned = Column(Integer, default=0)  # Points awarded for correct pick
-    settled_at = Column(DateTime, default=datetime.utcnow)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    settled_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     # Relationships
     pick = relationship("Pick", back_populates="result")
     
     def __repr__(self):
         return f"<PickResult(pick_id={self.pick_id}, actual_value={self.actual_value}, is_winner={self.is_winner})>"
+
+
+class LeaderboardSnapshot(Base):
+    """
+    Precomputed group standings for one leaderboard period.
+    
+    Rebuilt periodically by refresh_leaderboard_snapshots so leaderboard reads
+    are an index range scan instead of an aggregation over every settled pick.
+    """
+    __tablename__ = "leaderboard_snapshots"
+    __table_args__ = (UniqueConstraint("group_id", "period", "rank", name="uq_lbs_group_period_rank"),)
+    
+    id = Column(Integer, primary_key=True)
+    group_id = Column(Integer, ForeignKey("groups.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    period = Column(String(20), nullable=False)  # e.g., "all_time", "season", "month", "week"
+    rank = Column(Integer, nullable=False)
+    wins = Column(Integer, default=0)
+    losses = Column(Integer, default=0)
+    points = Column(Integer, default=0)  # Sum of PickResult.points_earned
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    def __repr__(self):
+        return f"<LeaderboardSnapshot(group_id={self.group_id}, period='{self.period}', rank={self.rank}, user_id={self.user_id})>"
+
+
+def upsert_stats(session, rows, model=PlayerGameStat) -> None:
+    """
+    Insert or update stat rows keyed by (player_id, game_id) in one statement.
+    
+    Works for PlayerGameStat and PlayerExpectedStat on SQLite and PostgreSQL.
+    Every row must provide the same keys.
+    
+    Args:
+        session: SQLAlchemy session to execute on (caller commits)
+        rows: List of column-name -> value dicts
+        model: Stat model to write to
+    """
+    if not rows:
+        return
+    
+    dialect = session.get_bind().dialect.name
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    elif dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        raise ValueError(f"upsert_stats does not support the {dialect} dialect")
+    
+    stmt = insert(model.__table__).values(rows)
+    update_cols = [c for c in rows[0] if c not in ("id", "player_id", "game_id", "created_at")]
+    set_ = {c: stmt.excluded[c] for c in update_cols}
+    # onupdate defaults are not applied to ON CONFLICT DO UPDATE
+    set_["updated_at"] = func.now()
+    stmt = stmt.on_conflict_do_update(index_elements=["player_id", "game_id"], set_=set_)
+    session.execute(stmt)
+
+
+def paged_picks(session, *criteria, limit=50, offset=0):
+    """
+    Page through picks newest-first using a deferred join.
+    
+    The inner query selects only ids, which the (group_id, created_at, id) and
+    (user_id, created_at, id) indexes can answer, so rows skipped by OFFSET are
+    never read in full; only the ids on the requested page are joined back to
+    whole Pick rows.
+    
+    Args:
+        session: SQLAlchemy session
+        *criteria: Filter expressions, e.g. Pick.group_id == 3
+        limit: Page size
+        offset: Rows to skip
+    
+    Returns:
+        List of Pick objects, newest first
+    """
+    order = (Pick.created_at.desc(), Pick.id.desc())
+    page_ids = (
+        select(Pick.id)
+        .where(*criteria)
+        .order_by(*order)
+        .limit(limit)
+        .offset(offset)
+        .subquery()
+    )
+    stmt = select(Pick).join(page_ids, Pick.id == page_ids.c.id).order_by(*order)
+    return session.execute(stmt).scalars().all()
+
+
+def refresh_leaderboard_snapshots(session, period, since=None) -> None:
+    """
+    Recompute the stored standings for one period in two statements.
+    
+    Meant to run from a periodic job (cron, Celery beat, ...) rather than on
+    read. Users are ranked per group by points, then wins, then user id; the
+    whole ranking happens in the database and is written back with
+    INSERT ... SELECT.
+    
+    Args:
+        session: SQLAlchemy session to execute on (caller commits)
+        period: Period label stored on the snapshot rows
+        since: Only count picks created at or after this datetime (None = all time)
+    """
+    wins = func.sum(case((PickResult.is_winner, 1), else_=0))
+    losses = func.count(PickResult.id) - wins
+    points = func.coalesce(func.sum(PickResult.points_earned), 0)
+    rank = func.row_number().over(
+        partition_by=Pick.group_id,
+        order_by=(points.desc(), wins.desc(), Pick.user_id),
+    )
+    standings = (
+        select(Pick.group_id, Pick.user_id, literal(period), rank, wins, losses, points)
+        .join(PickResult, PickResult.pick_id == Pick.id)
+        .group_by(Pick.group_id, Pick.user_id)
+    )
+    if since is not None:
+        standings = standings.where(Pick.created_at >= since)
+    
+    table = LeaderboardSnapshot.__table__
+    session.execute(table.delete().where(table.c.period == period))
+    session.execute(table.insert().from_select(
+        ["group_id", "user_id", "period", "rank", "wins", "losses", "points"], standings
+    ))
+
+
+def leaderboard_snapshot(session, group_id, period, limit=100, after_rank=0):
+    """
+    Read one page of a group's stored standings.
+    
+    Ranks are dense per (group, period), so the page after `after_rank` (the last
+    rank the client saw, or an offset) is a range on the unique index and deep
+    pages cost the same as the first.
+    
+    Returns:
+        List of LeaderboardSnapshot rows ordered by rank
+    """
+    stmt = (
+        select(LeaderboardSnapshot)
+        .where(
+            LeaderboardSnapshot.group_id == group_id,
+            LeaderboardSnapshot.period == period,
+            LeaderboardSnapshot.rank > after_rank,
+        )
+        .order_by(LeaderboardSnapshot.rank)
+        .limit(limit)
+    )
+    return session.execute(stmt).scalars().all()
@@ -7,10 +7,270 @@ using the nba_api library.
 Created: 2026-01-08 05:34:12 UTC
 """
 
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+import logging
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from datetime import datetime
+from functools import lru_cache, wraps
+from typing import List, Dict, Any, Optional, Tuple
 from nba_api.client import Client
+from nba_api.stats.static import players as nba_players
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+
+_DATE_RE = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}')
+
+# Concurrent scoreboard requests in get_game_date_range; kept small because
+# stats.nba.com throttles aggressive clients.
+_DATE_RANGE_WORKERS = 5
+
+# Attempts per day when stats.nba.com answers 429, and the base of the
+# exponential backoff used when it sends no Retry-After header.
+_RATE_LIMIT_ATTEMPTS = 3
+_RATE_LIMIT_BACKOFF_SECONDS = 0.5
+_RATE_LIMIT_MAX_DELAY_SECONDS = 10.0
+
+# Source column -> output key for each extractor, in output order.
+_GAME_COLUMNS = {
+    'GAME_ID': 'game_id',
+    'GAME_DATETIME_EST': 'game_datetime',
+    'HOME_TEAM_ID': 'home_team_id',
+    'HOME_TEAM_NAME': 'home_team_name',
+    'VISITOR_TEAM_ID': 'away_team_id',
+    'VISITOR_TEAM_NAME': 'away_team_name',
+    'HOME_TEAM_WINS': 'home_team_score',
+    'VISITOR_TEAM_WINS': 'away_team_score',
+    'GAME_STATUS_TEXT': 'game_status',
+}
+
+_PLAYER_BOX_COLUMNS = {
+    'PLAYER_ID': 'player_id',
+    'PLAYER_NAME': 'player_name',
+    'TEAM_ID': 'team_id',
+    'TEAM_ABBREVIATION': 'team_name',
+    'MIN': 'minutes',
+    'FGM': 'field_goals_made',
+    'FGA': 'field_goals_attempted',
+    'FG%': 'field_goal_percentage',
+    'FG3M': 'three_pointers_made',
+    'FG3A': 'three_pointers_attempted',
+    'FG3%': 'three_point_percentage',
+    'FTM': 'free_throws_made',
+    'FTA': 'free_throws_attempted',
+    'FT%': 'free_throw_percentage',
+    'OREB': 'offensive_rebounds',
+    'DREB': 'defensive_rebounds',
+    'REB': 'total_rebounds',
+    'AST': 'assists',
+    'STL': 'steals',
+    'BLK': 'blocks',
+    'TOV': 'turnovers',
+    'PF': 'personal_fouls',
+    'PTS': 'points',
+    '+/-': 'plus_minus',
+}
+
+_TEAM_BOX_COLUMNS = {
+    'TEAM_ID': 'team_id',
+    'TEAM_NAME': 'team_name',
+    'MIN': 'minutes',
+    'FGM': 'field_goals_made',
+    'FGA': 'field_goals_attempted',
+    'FG%': 'field_goal_percentage',
+    'FG3M': 'three_pointers_made',
+    'FG3A': 'three_pointers_attempted',
+    'FG3%': 'three_point_percentage',
+    'FTM': 'free_throws_made',
+    'FTA': 'free_throws_attempted',
+    'FT%': 'free_throw_percentage',
+    'OREB': 'offensive_rebounds',
+    'DREB': 'defensive_rebounds',
+    'REB': 'total_rebounds',
+    'AST': 'assists',
+    'STL': 'steals',
+    'BLK': 'blocks',
+    'TOV': 'turnovers',
+    'PF': 'personal_fouls',
+    'PTS': 'points',
+}
+
+# Output key -> (source column, type) for season averages; missing/null -> 0.
+_SEASON_STAT_COLUMNS = {
+    'games_played': ('GP', int),
+    'minutes': ('MIN', float),
+    'points_per_game': ('PTS', float),
+    'assists_per_game': ('AST', float),
+    'rebounds_per_game': ('REB', float),
+    'field_goal_percentage': ('FG%', float),
+    'three_point_percentage': ('3P%', float),
+    'free_throw_percentage': ('FT%', float),
+    'steals_per_game': ('STL', float),
+    'blocks_per_game': ('BLK', float),
+    'turnovers_per_game': ('TOV', float),
+}
+
+_ROSTER_COLUMNS = {
+    'PLAYER_ID': 'player_id',
+    'PLAYER_NAME': 'player_name',
+    'NUM': 'jersey_number',
+    'POSITION': 'position',
+    'HEIGHT': 'height',
+    'WEIGHT': 'weight',
+    'BIRTHDATE': 'birth_date',
+    'EXP': 'years_in_league',
+}
+
+
+# (method, args) -> (expires_at monotonic, result). Finished games, rosters and
+# player bios barely change, so they are kept far longer than anything live.
+_RESPONSE_CACHE: Dict[tuple, Tuple[float, Any]] = {}
+_CACHE_LOCK = threading.Lock()
+_STATIC_TTL_SECONDS = 12 * 60 * 60
+_LIVE_TTL_SECONDS = 2 * 60
+
+
+def _cache_get(key: tuple) -> Any:
+    entry = _RESPONSE_CACHE.get(key)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+
+def _cache_put(key: tuple, value: Any, ttl: float) -> None:
+    now = time.monotonic()
+    with _CACHE_LOCK:
+        for stale in [k for k, (expires, _) in _RESPONSE_CACHE.items() if expires <= now]:
+            del _RESPONSE_CACHE[stale]
+        _RESPONSE_CACHE[key] = (now + ttl, value)
+
+
+# (method, args) -> Future of the upstream call currently running for it.
+_INFLIGHT: Dict[tuple, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+def _coalesced(method):
+    """
+    Single-flight wrapper: while a call with the same arguments is already in
+    progress, other threads wait for its result instead of hitting stats.nba.com
+    again. Complements the TTL cache, which only helps once a call has finished.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        with _INFLIGHT_LOCK:
+            future = _INFLIGHT.get(key)
+            leader = future is None
+            if leader:
+                future = _INFLIGHT[key] = Future()
+        if not leader:
+            return future.result()
+        try:
+            result = method(self, *args, **kwargs)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            with _INFLIGHT_LOCK:
+                del _INFLIGHT[key]
+        future.set_result(result)
+        return result
+    return wrapper
+
+
+@dataclass(slots=True)
+class PlayerBoxStat:
+    """One player's line in a box score (fields follow _PLAYER_BOX_COLUMNS)"""
+    player_id: int
+    player_name: str
+    team_id: int
+    team_name: str
+    minutes: Optional[str]
+    field_goals_made: Optional[float]
+    field_goals_attempted: Optional[float]
+    field_goal_percentage: Optional[float]
+    three_pointers_made: Optional[float]
+    three_pointers_attempted: Optional[float]
+    three_point_percentage: Optional[float]
+    free_throws_made: Optional[float]
+    free_throws_attempted: Optional[float]
+    free_throw_percentage: Optional[float]
+    offensive_rebounds: Optional[float]
+    defensive_rebounds: Optional[float]
+    total_rebounds: Optional[float]
+    assists: Optional[float]
+    steals: Optional[float]
+    blocks: Optional[float]
+    turnovers: Optional[float]
+    personal_fouls: Optional[float]
+    points: Optional[float]
+    plus_minus: Optional[float]
+
+
+@dataclass(slots=True)
+class TeamBoxStat:
+    """One team's line in a box score (fields follow _TEAM_BOX_COLUMNS)"""
+    team_id: int
+    team_name: str
+    minutes: Optional[str]
+    field_goals_made: Optional[float]
+    field_goals_attempted: Optional[float]
+    field_goal_percentage: Optional[float]
+    three_pointers_made: Optional[float]
+    three_pointers_attempted: Optional[float]
+    three_point_percentage: Optional[float]
+    free_throws_made: Optional[float]
+    free_throws_attempted: Optional[float]
+    free_throw_percentage: Optional[float]
+    offensive_rebounds: Optional[float]
+    defensive_rebounds: Optional[float]
+    total_rebounds: Optional[float]
+    assists: Optional[float]
+    steals: Optional[float]
+    blocks: Optional[float]
+    turnovers: Optional[float]
+    personal_fouls: Optional[float]
+    points: Optional[float]
+
+
+@lru_cache(maxsize=1)
+def _season_for_year(year: int) -> str:
+    """Season string ('YYYY-YY') starting in the given year"""
+    return f"{year}-{str(year + 1)[-2:]}"
+
+
+def _rate_limit_delay(exc: Exception, attempt: int) -> Optional[float]:
+    """Seconds to wait before retrying a rate-limited request, or None if exc is not a 429."""
+    response = getattr(exc, 'response', None)
+    if getattr(response, 'status_code', None) != 429:
+        return None
+    try:
+        delay = float(response.headers.get('Retry-After'))
+    except (TypeError, ValueError):
+        delay = _RATE_LIMIT_BACKOFF_SECONDS * 2 ** attempt
+    return min(max(delay, 0.0), _RATE_LIMIT_MAX_DELAY_SECONDS)
+
+
+def _records(result_set: Dict[str, Any], columns: Dict[str, str]) -> List[Dict[str, Any]]:
+    """Build output dicts straight from a raw nba_api result set (no DataFrame)."""
+    headers = result_set['headers']
+    positions = [(key, headers.index(column)) for column, key in columns.items()]
+    return [{key: row[i] for key, i in positions} for row in result_set['rowSet']]
+
+
+def _objects(result_set: Dict[str, Any], columns: Dict[str, str], row_type: type) -> List[Any]:
+    """Like _records, but builds row_type instances whose fields are the output keys."""
+    headers = result_set['headers']
+    source = {key: column for column, key in columns.items()}
+    positions = [headers.index(source[field.name]) for field in fields(row_type)]
+    return [row_type(*[row[i] for i in positions]) for row in result_set['rowSet']]
 
 
 class NBAService:
@@ -19,7 +279,20 @@ class NBAService:
     def __init__(self):
         """Initialize NBA Service with nba_api client"""
         self.client = Client()
-
+        # Widen the keep-alive pool so concurrent date-range fetches reuse
+        # connections instead of opening new ones.
+        session = getattr(self.client, 'session', None)
+        if isinstance(session, requests.Session):
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+        # nba_api ships the full player list offline; index it once by name.
+        # Names repeat (e.g. "Charles Smith"); keep the first, as the search did.
+        self._players_by_name = {}
+        for p in nba_players.get_players():
+            self._players_by_name.setdefault(p['full_name'].lower(), p)
+
+    @_coalesced
     def fetch_games_by_date(self, date: str) -> List[Dict[str, Any]]:
         """
         Fetch all NBA games for a specific date.
@@ -33,39 +306,34 @@ class NBAService:
         Raises:
             ValueError: If date format is invalid
         """
-        try:
-            # Validate date format
-            datetime.strptime(date, '%Y-%m-%d')
-        except ValueError:
+        # Validate date format (impossible dates like 02-30 are left to stats.nba.com)
+        if not _DATE_RE.fullmatch(date):
             raise ValueError("Date must be in format 'YYYY-MM-DD'")
 
+        cache_key = ('games', date)
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             games_data = self.client.scoreboard_v2(date_string=date)
-            games = games_data.get_data_frames()[0]
+            result_set = games_data.get_dict()['resultSets'][0]
 
-            if games.empty:
+            if not result_set['rowSet']:
+                _cache_put(cache_key, [], _LIVE_TTL_SECONDS)
                 return []
 
             # Extract relevant game information
-            games_list = []
-            for _, game in games.iterrows():
-                game_info = {
-                    'game_id': game['GAME_ID'],
-                    'game_datetime': game['GAME_DATETIME_EST'],
-                    'home_team_id': game['HOME_TEAM_ID'],
-                    'home_team_name': game['HOME_TEAM_NAME'],
-                    'away_team_id': game['VISITOR_TEAM_ID'],
-                    'away_team_name': game['VISITOR_TEAM_NAME'],
-                    'home_team_score': game['HOME_TEAM_WINS'],
-                    'away_team_score': game['VISITOR_TEAM_WINS'],
-                    'game_status': game['GAME_STATUS_TEXT']
-                }
-                games_list.append(game_info)
+            games_list = _records(result_set, _GAME_COLUMNS)
 
+            # A slate only stops changing once every game is final
+            all_final = all('Final' in str(game['game_status']) for game in games_list)
+            _cache_put(cache_key, games_list, _STATIC_TTL_SECONDS if all_final else _LIVE_TTL_SECONDS)
             return games_list
 
-        except Exception as e:
-            raise Exception(f"Error fetching games for date {date}: {str(e)}")
+        except Exception:
+            logger.exception(f"Error fetching games for date {date}")
+            raise
 
     def fetch_todays_games(self) -> List[Dict[str, Any]]:
         """
@@ -77,6 +345,7 @@ class NBAService:
         today = datetime.utcnow().strftime('%Y-%m-%d')
         return self.fetch_games_by_date(today)
 
+    @_coalesced
     def fetch_player_info(self, player_name: str) -> Optional[Dict[str, Any]]:
         """
         Fetch detailed information about a specific player.
@@ -87,14 +356,21 @@ class NBAService:
         Returns:
             Optional[Dict[str, Any]]: Player information including ID, team, stats, etc.
         """
+        cache_key = ('player', player_name)
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            # Get all players
-            all_players = self.client.find_player_by_name(player_name)
+            player = self._players_by_name.get(player_name.strip().lower())
+            if player is None:
+                # Not an exact full name; fall back to the client's search
+                all_players = self.client.find_player_by_name(player_name)
 
-            if not all_players:
-                return None
+                if not all_players:
+                    return None
 
-            player = all_players[0]
+                player = all_players[0]
 
             player_info = {
                 'player_id': player['id'],
@@ -109,11 +385,14 @@ class NBAService:
                 'draft_number': player.get('draft_number')
             }
 
+            _cache_put(cache_key, player_info, _STATIC_TTL_SECONDS)
             return player_info
 
-        except Exception as e:
-            raise Exception(f"Error fetching player info for {player_name}: {str(e)}")
+        except Exception:
+            logger.exception(f"Error fetching player info for {player_name}")
+            raise
 
+    @_coalesced
     def fetch_player_season_stats(self, player_id: int, season: str = None) -> Optional[Dict[str, Any]]:
         """
         Fetch season statistics for a specific player.
@@ -127,8 +406,12 @@ class NBAService:
             Optional[Dict[str, Any]]: Player season statistics
         """
         if season is None:
-            current_year = datetime.utcnow().year
-            season = f"{current_year}-{str(current_year + 1)[-2:]}"
+            season = _season_for_year(datetime.utcnow().year)
+
+        cache_key = ('season', player_id, season)
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
 
         try:
             player_stats = self.client.player_stat_data(
@@ -136,33 +419,26 @@ class NBAService:
                 season=season
             )
 
-            stats_df = player_stats.get_data_frames()[0]
+            result_set = player_stats.get_dict()['resultSets'][0]
 
-            if stats_df.empty:
+            if not result_set['rowSet']:
                 return None
 
-            stats_row = stats_df.iloc[0]
-            season_stats = {
-                'player_id': player_id,
-                'season': season,
-                'games_played': int(stats_row.get('GP', 0)),
-                'minutes': float(stats_row.get('MIN', 0)),
-                'points_per_game': float(stats_row.get('PTS', 0)),
-                'assists_per_game': float(stats_row.get('AST', 0)),
-                'rebounds_per_game': float(stats_row.get('REB', 0)),
-                'field_goal_percentage': float(stats_row.get('FG%', 0)),
-                'three_point_percentage': float(stats_row.get('3P%', 0)),
-                'free_throw_percentage': float(stats_row.get('FT%', 0)),
-                'steals_per_game': float(stats_row.get('STL', 0)),
-                'blocks_per_game': float(stats_row.get('BLK', 0)),
-                'turnovers_per_game': float(stats_row.get('TOV', 0))
-            }
+            stats_row = dict(zip(result_set['headers'], result_set['rowSet'][0]))
+            season_stats = {'player_id': player_id, 'season': season}
+            season_stats.update({
+                key: cast(stats_row.get(column) or 0)
+                for key, (column, cast) in _SEASON_STAT_COLUMNS.items()
+            })
 
+            _cache_put(cache_key, season_stats, _LIVE_TTL_SECONDS)
             return season_stats
 
-        except Exception as e:
-            raise Exception(f"Error fetching player stats for player_id {player_id}: {str(e)}")
+        except Exception:
+            logger.exception(f"Error fetching player stats for player_id {player_id}")
+            raise
 
+    @_coalesced
     def fetch_box_score(self, game_id: str) -> Dict[str, Any]:
         """
         Fetch detailed box score for a specific game.
@@ -171,76 +447,23 @@ class NBAService:
             game_id (str): The game ID
 
         Returns:
-            Dict[str, Any]: Box score data including player stats and team stats
+            Dict[str, Any]: Box score data; 'player_stats' and 'team_stats' hold
+                PlayerBoxStat / TeamBoxStat rows
         """
+        cache_key = ('box', game_id)
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             box_score = self.client.box_score_v2(game_id=game_id)
-            data_frames = box_score.get_data_frames()
-
-            # Player box score data
-            player_stats_df = data_frames[0]
-
-            # Team box score data
-            team_stats_df = data_frames[1]
+            result_sets = box_score.get_dict()['resultSets']
 
             # Extract player statistics
-            players_stats = []
-            for _, player in player_stats_df.iterrows():
-                player_stat = {
-                    'player_id': player['PLAYER_ID'],
-                    'player_name': player['PLAYER_NAME'],
-                    'team_id': player['TEAM_ID'],
-                    'team_name': player['TEAM_ABBREVIATION'],
-                    'minutes': player['MIN'],
-                    'field_goals_made': player['FGM'],
-                    'field_goals_attempted': player['FGA'],
-                    'field_goal_percentage': player['FG%'],
-                    'three_pointers_made': player['FG3M'],
-                    'three_pointers_attempted': player['FG3A'],
-                    'three_point_percentage': player['FG3%'],
-                    'free_throws_made': player['FTM'],
-                    'free_throws_attempted': player['FTA'],
-                    'free_throw_percentage': player['FT%'],
-                    'offensive_rebounds': player['OREB'],
-                    'defensive_rebounds': player['DREB'],
-                    'total_rebounds': player['REB'],
-                    'assists': player['AST'],
-                    'steals': player['STL'],
-                    'blocks': player['BLK'],
-                    'turnovers': player['TOV'],
-                    'personal_fouls': player['PF'],
-                    'points': player['PTS'],
-                    'plus_minus': player['+/-']
-                }
-                players_stats.append(player_stat)
+            players_stats = _objects(result_sets[0], _PLAYER_BOX_COLUMNS, PlayerBoxStat)
 
             # Extract team statistics
-            team_stats = []
-            for _, team in team_stats_df.iterrows():
-                team_stat = {
-                    'team_id': team['TEAM_ID'],
-                    'team_name': team['TEAM_NAME'],
-                    'minutes': team['MIN'],
-                    'field_goals_made': team['FGM'],
-                    'field_goals_attempted': team['FGA'],
-                    'field_goal_percentage': team['FG%'],
-                    'three_pointers_made': team['FG3M'],
-                    'three_pointers_attempted': team['FG3A'],
-                    'three_point_percentage': team['FG3%'],
-                    'free_throws_made': team['FTM'],
-                    'free_throws_attempted': team['FTA'],
-                    'free_throw_percentage': team['FT%'],
-                    'offensive_rebounds': team['OREB'],
-                    'defensive_rebounds': team['DREB'],
-                    'total_rebounds': team['REB'],
-                    'assists': team['AST'],
-                    'steals': team['STL'],
-                    'blocks': team['BLK'],
-                    'turnovers': team['TOV'],
-                    'personal_fouls': team['PF'],
-                    'points': team['PTS']
-                }
-                team_stats.append(team_stat)
+            team_stats = _objects(result_sets[1], _TEAM_BOX_COLUMNS, TeamBoxStat)
 
             box_score_data = {
                 'game_id': game_id,
@@ -248,11 +471,15 @@ class NBAService:
                 'team_stats': team_stats
             }
 
+            # Game status isn't part of the box score, so treat it as possibly live
+            _cache_put(cache_key, box_score_data, _LIVE_TTL_SECONDS)
             return box_score_data
 
-        except Exception as e:
-            raise Exception(f"Error fetching box score for game_id {game_id}: {str(e)}")
+        except Exception:
+            logger.exception(f"Error fetching box score for game_id {game_id}")
+            raise
 
+    @_coalesced
     def fetch_team_roster(self, team_id: int) -> List[Dict[str, Any]]:
         """
         Fetch roster information for a specific team.
@@ -263,31 +490,26 @@ class NBAService:
         Returns:
             List[Dict[str, Any]]: List of players on the team with their information
         """
+        cache_key = ('roster', team_id)
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             common_team_roster = self.client.commonteamroster(team_id=team_id)
-            roster_df = common_team_roster.get_data_frames()[0]
+            result_set = common_team_roster.get_dict()['resultSets'][0]
 
-            if roster_df.empty:
+            if not result_set['rowSet']:
                 return []
 
-            roster = []
-            for _, player in roster_df.iterrows():
-                player_info = {
-                    'player_id': player['PLAYER_ID'],
-                    'player_name': player['PLAYER_NAME'],
-                    'jersey_number': player['NUM'],
-                    'position': player['POSITION'],
-                    'height': player['HEIGHT'],
-                    'weight': player['WEIGHT'],
-                    'birth_date': player['BIRTHDATE'],
-                    'years_in_league': player['EXP']
-                }
-                roster.append(player_info)
+            roster = _records(result_set, _ROSTER_COLUMNS)
 
+            _cache_put(cache_key, roster, _STATIC_TTL_SECONDS)
             return roster
 
-        except Exception as e:
-            raise Exception(f"Error fetching roster for team_id {team_id}: {str(e)}")
+        except Exception:
+            logger.exception(f"Error fetching roster for team_id {team_id}")
+            raise
 
     def get_game_date_range(self, start_date: str, end_date: str) -> List[Dict[str, Any]]:
         """
@@ -306,48 +528,73 @@ class NBAService:
         except ValueError:
             raise ValueError("Dates must be in format 'YYYY-MM-DD'")
 
+        dates = pd.date_range(start, end, freq='D').strftime('%Y-%m-%d').tolist()
+
+        if not dates:
+            return []
+
+        # Each day is a separate blocking round-trip; fetch them concurrently
+        # and collect in date order.
+        with ThreadPoolExecutor(max_workers=min(_DATE_RANGE_WORKERS, len(dates))) as pool:
+            futures = [pool.submit(self._fetch_games_with_backoff, date_str) for date_str in dates]
+
         all_games = []
-        current_date = start
+        for date_str, future in zip(dates, futures):
+            try:
+                all_games.extend(future.result())
+            except Exception as e:
+                logger.warning("Could not fetch games for %s: %s", date_str, e)
 
-        while current_date <= end:
-            date_str = current_date.strftime('%Y-%m-%d')
+        return all_games
+
+    def _fetch_games_with_backoff(self, date: str) -> List[Dict[str, Any]]:
+        """fetch_games_by_date, retried a bounded number of times on 429 responses."""
+        for attempt in range(_RATE_LIMIT_ATTEMPTS):
             try:
-                games = self.fetch_games_by_date(date_str)
-                all_games.extend(games)
+                return self.fetch_games_by_date(date)
             except Exception as e:
-                print(f"Warning: Could not fetch games for {date_str}: {str(e)}")
+                delay = _rate_limit_delay(e, attempt)
+                if delay is None or attempt == _RATE_LIMIT_ATTEMPTS - 1:
+                    raise
+                logger.info("Rate limited fetching games for %s; retrying in %.1fs", date, delay)
+                time.sleep(delay)
 
-            current_date += timedelta(days=1)
 
-        return all_games
+_service_singleton: Optional[NBAService] = None
+_service_lock = threading.Lock()
+
+
+def _get_service() -> NBAService:
+    """Return the shared NBAService, creating it on first use"""
+    global _service_singleton
+    if _service_singleton is None:
+        with _service_lock:
+            if _service_singleton is None:
+                _service_singleton = NBAService()
+    return _service_singleton
 
 
 # Module-level functions for convenience
 def fetch_games_by_date(date: str) -> List[Dict[str, Any]]:
     """Convenience function to fetch games by date"""
-    service = NBAService()
-    return service.fetch_games_by_date(date)
+    return _get_service().fetch_games_by_date(date)
 
 
 def fetch_todays_games() -> List[Dict[str, Any]]:
     """Convenience function to fetch today's games"""
-    service = NBAService()
-    return service.fetch_todays_games()
+    return _get_service().fetch_todays_games()
 
 
 def fetch_player_info(player_name: str) -> Optional[Dict[str, Any]]:
     """Convenience function to fetch player information"""
-    service = NBAService()
-    return service.fetch_player_info(player_name)
+    return _get_service().fetch_player_info(player_name)
 
 
 def fetch_box_score(game_id: str) -> Dict[str, Any]:
     """Convenience function to fetch box score"""
-    service = NBAService()
-    return service.fetch_box_score(game_id)
+    return _get_service().fetch_box_score(game_id)
 
 
 def fetch_team_roster(team_id: int) -> List[Dict[str, Any]]:
     """Convenience function to fetch team roster"""
-    service = NBAService()
-    return service.fetch_team_roster(team_id)
+    return _get_service().fetch_team_roster(team_id)
@@ -1,12 +1,34 @@
 """
 Beat the Line NBA Application - API Routes
 Comprehensive routes for group management, NBA data, picks, and leaderboards
+
+Handlers are synchronous and spend most of their time waiting on stats.nba.com
+or the database, so never serve the app that registers this blueprint with sync
+workers or the dev server. Preferred: gevent workers
+(`gunicorn -k gevent -w $((2 * CPUS + 1)) --worker-connections 1000 wsgi:app`),
+with `from gevent import monkey; monkey.patch_all()` as the first lines of the
+WSGI module and `psycogreen.gevent.patch_psycopg()` before the engine is created
+so database waits yield too. Without gevent, use threads
+(`gunicorn -k gthread --workers 4 --threads 32`). Either way nba_service shares
+one pooled NBAService, so workers reuse keep-alive connections.
 """
 
-from flask import Blueprint, request, jsonify
-from datetime import datetime
+from flask import Blueprint, current_app, g, request, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.exceptions import HTTPException
+from datetime import date, datetime
+from http import HTTPStatus
 from functools import wraps
+from typing import Literal, Optional
+import base64
 import logging
+import threading
+import time
+
+import orjson
+import requests
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+from nba_api.stats.static import teams as nba_teams
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -15,6 +37,275 @@ logger = logging.getLogger(__name__)
 api = Blueprint('api', __name__, url_prefix='/api')
 
 
+# Naive datetimes are UTC throughout this API (datetime.utcnow()). Non-string
+# dict keys (e.g. int ids) are stringified like the stdlib provider does.
+_ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+    
+    Installed on any app that registers this blueprint, so jsonify, error
+    pages and request.get_json() all go through orjson. Types orjson does not
+    handle natively (Decimal, __html__) fall back to Flask's default hook.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=_ORJSON_OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=_ORJSON_OPTIONS)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+@api.record_once
+def install_json_provider(state):
+    state.app.json = OrjsonProvider(state.app)
+
+
+def _json_default():
+    """The app's JSON default hook, so ojson and jsonify serialize the same types"""
+    return getattr(current_app.json, 'default', DefaultJSONProvider.default)
+
+
+def ojson(payload):
+    """Serialize payload with orjson; drop-in for jsonify in (body, status) returns"""
+    return current_app.response_class(
+        orjson.dumps(payload, default=_json_default(), option=_ORJSON_OPTIONS),
+        mimetype='application/json'
+    )
+
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+
+def wants_ndjson():
+    """True when the client prefers newline-delimited JSON over a JSON envelope"""
+    return request.accept_mimetypes.best_match(['application/json', NDJSON_MIMETYPE]) == NDJSON_MIMETYPE
+
+
+def ndjson_stream(rows, next_cursor=None):
+    """
+    Stream rows as NDJSON, one document per line, serialized as they are pulled
+    
+    rows can be any iterable (e.g. a query with .yield_per(100)), so large lists
+    are never materialized or buffered as one body. next_cursor, when given, is
+    sent in the X-Next-Cursor header.
+    """
+    default = _json_default()
+
+    def generate():
+        for row in rows:
+            yield orjson.dumps(row, default=default, option=_ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE)
+    response = current_app.response_class(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
+    if next_cursor is not None:
+        response.headers['X-Next-Cursor'] = next_cursor
+    return response
+
+
+# ============================================================================
+# QUERY PARAMETERS
+# ============================================================================
+# Each GET view validates its query string once against one of these models.
+# Values are coerced in a single pass ('false' -> False, '50' -> 50,
+# 'YYYY-MM-DD' -> date); bad input is raised as InvalidRequest and answered
+# with a 400.
+
+# Largest page any list view will return in one response.
+MAX_PAGE_LIMIT = 500
+
+Period = Literal['all_time', 'season', 'month', 'week']
+PickStatus = Literal['pending', 'won', 'lost', 'push']
+OptionalDate = Optional[date]
+
+
+class QueryModel(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
+
+class GamesQuery(QueryModel):
+    date: OptionalDate = None
+    team: Optional[str] = None
+    status: Literal['upcoming', 'live', 'completed'] = 'upcoming'
+
+
+class StandingsQuery(QueryModel):
+    conference: Optional[Literal['east', 'west']] = None
+    season: Optional[int] = None
+
+
+class LinesQuery(QueryModel):
+    game_id: Optional[str] = None
+    date: OptionalDate = None
+
+
+class PicksQuery(QueryModel):
+    group_id: Optional[str] = None
+    status: Optional[PickStatus] = None
+    start_date: OptionalDate = None
+    end_date: OptionalDate = None
+
+
+class GroupPicksQuery(QueryModel):
+    status: Optional[PickStatus] = None
+    user_id: Optional[str] = None
+
+
+class PeriodQuery(QueryModel):
+    period: Period = 'season'
+
+
+class PageQuery(QueryModel):
+    limit: int = Field(100, ge=1, le=MAX_PAGE_LIMIT)
+    cursor: Optional[str] = None
+    offset: int = Field(0, ge=0)
+
+
+class LeaderboardQuery(PeriodQuery, PageQuery):
+    pass
+
+
+class StatLeaderboardQuery(PageQuery):
+    group_id: Optional[str] = None
+
+
+class HeadToHeadQuery(PeriodQuery):
+    user_id_1: str = Field(min_length=1)
+    user_id_2: str = Field(min_length=1)
+    group_id: Optional[str] = None
+
+
+class NotificationsQuery(QueryModel):
+    unread_only: bool = False
+    limit: int = Field(50, ge=1, le=MAX_PAGE_LIMIT)
+
+
+class ActivityQuery(QueryModel):
+    limit: int = Field(50, ge=1, le=MAX_PAGE_LIMIT)
+    activity_type: Optional[Literal['pick', 'member_join', 'game_result']] = None
+
+
+class InvalidRequest(Exception):
+    """Client input a view rejects on purpose; reported as a 400 with its message"""
+
+
+def parse_query(model):
+    """Validate and coerce request.args against a query model (once per request)"""
+    parsed = g.setdefault('parsed_queries', {})
+    if model in parsed:
+        return parsed[model]
+    try:
+        query = parsed[model] = model.model_validate(request.args.to_dict())
+    except ValidationError as e:
+        problems = (
+            f"{'.'.join(map(str, err['loc']))}: {err['msg']}"
+            for err in e.errors(include_url=False, include_input=False)
+        )
+        raise InvalidRequest('; '.join(problems)) from None
+    return query
+
+
+def error_status(exc):
+    """Map an exception escaping a view to an HTTP status code"""
+    if isinstance(exc, InvalidRequest):
+        return 400
+    if isinstance(exc, (TimeoutError, requests.Timeout)):
+        return 504
+    if isinstance(exc, requests.HTTPError):
+        upstream = exc.response
+        return 429 if upstream is not None and upstream.status_code == 429 else 502
+    if isinstance(exc, requests.RequestException):
+        return 502
+    return 500
+
+
+# (endpoint, path, parsed query) -> (expires_at monotonic, body, status) for
+# cached_read views, oldest first. Per-process and bounded; pick writes clear it.
+_READ_CACHE = {}
+_READ_CACHE_LOCK = threading.Lock()
+_READ_CACHE_MAX_ENTRIES = 1024
+_LONG_PERIODS = ('season', 'all_time')
+
+_REQUIRED_PICK_FIELDS = frozenset({'game_id', 'group_id', 'pick_type', 'selection', 'line'})
+
+
+def cached_read(query=None, ttl=30, long_ttl=None):
+    """
+    Cache a read-only view's successful JSON response for a short window.
+    
+    Identical requests inside the window are served from memory without running
+    the view. Requests are keyed by path plus the view's parsed query model, so
+    query arguments the view ignores do not create new entries.
+    
+    Args:
+        - query: Query model the view parses (None if it reads no query string)
+        - ttl: Seconds to keep a response
+        - long_ttl: Seconds for season / all-time periods, which change slowly
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated(*args, **kwargs):
+            if wants_ndjson():
+                # Streamed bodies are not cached
+                return f(*args, **kwargs)
+            parsed = parse_query(query) if query is not None else None
+            key = (request.endpoint, request.path, parsed)
+            now = time.monotonic()
+            entry = _READ_CACHE.get(key)
+            if entry and entry[0] > now:
+                return current_app.response_class(entry[1], mimetype='application/json'), entry[2]
+            response, status = f(*args, **kwargs)
+            if status == 200:
+                expires_at = now + (long_ttl if long_ttl and parsed.period in _LONG_PERIODS else ttl)
+                with _READ_CACHE_LOCK:
+                    if len(_READ_CACHE) >= _READ_CACHE_MAX_ENTRIES:
+                        for stale in [k for k, (expires, _, _) in _READ_CACHE.items() if expires <= now]:
+                            del _READ_CACHE[stale]
+                    while len(_READ_CACHE) >= _READ_CACHE_MAX_ENTRIES:
+                        del _READ_CACHE[next(iter(_READ_CACHE))]
+                    _READ_CACHE.pop(key, None)
+                    _READ_CACHE[key] = (expires_at, response.get_data(), status)
+            return response, status
+        return decorated
+    return decorator
+
+
+def invalidate_read_cache():
+    """Drop every cached_read response (call after writes that affect standings)"""
+    with _READ_CACHE_LOCK:
+        _READ_CACHE.clear()
+
+
+@api.before_request
+def stamp_request_time():
+    """Format the request timestamp once; handlers reuse g.now_iso"""
+    if request.endpoint == 'api.health_check':
+        # Health pings use the shared per-second stamp instead
+        return
+    g.now_iso = datetime.utcnow().isoformat()
+
+
+# (expires_at monotonic, iso timestamp) shared by bursts of health pings
+_HEALTH_STAMP_TTL = 1.0
+_health_stamp = (0.0, '')
+
+
+def health_timestamp():
+    """ISO timestamp for health checks, reformatted at most once per second"""
+    global _health_stamp
+    now = time.monotonic()
+    expires_at, stamp = _health_stamp
+    if now >= expires_at:
+        stamp = datetime.utcnow().isoformat()
+        _health_stamp = (now + _HEALTH_STAMP_TTL, stamp)
+    return stamp
+
+
 # ============================================================================
 # Authentication & Middleware
 # ============================================================================
@@ -25,14 +316,14 @@ def token_required(f):
     def decorated(*args, **kwargs):
         token = request.headers.get('Authorization')
         if not token:
-            return jsonify({'error': 'Token is missing'}), 401
+            return ojson({'error': 'Token is missing'}), 401
         try:
             # Token verification logic would go here
             # For now, we'll assume token is valid
             pass
         except Exception as e:
             logger.error(f"Token verification failed: {str(e)}")
-            return jsonify({'error': 'Token is invalid'}), 401
+            return ojson({'error': 'Token is invalid'}), 401
         return f(*args, **kwargs)
     return decorated
 
@@ -50,17 +341,13 @@ def get_all_groups():
     Returns:
         - List of groups with basic info
     """
-    try:
-        # Database query logic here
-        groups = []  # Placeholder for actual DB query
-        return jsonify({
-            'status': 'success',
-            'data': groups,
-            'timestamp': datetime.utcnow().isoformat()
-        }), 200
-    except Exception as e:
-        logger.error(f"Error fetching groups: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+    # Database query logic here
+    groups = []  # Placeholder for actual DB query
+    return ojson({
+        'status': 'success',
+        'data': groups,
+        'timestamp': g.now_iso
+    }), 200
 
 
 @api.route('/groups', methods=['POST'])
@@ -78,32 +365,28 @@ def create_group():
     Returns:
         - Created group object with ID
     """
-    try:
-        data = request.get_json()
-        
-        # Validate required fields
-        if not data.get('name'):
-            return jsonify({'error': 'Group name is required'}), 400
-        
-        # Create group logic here
-        new_group = {
-            'id': 'group_id_placeholder',
-            'name': data.get('name'),
-            'description': data.get('description', ''),
-            'privacy': data.get('privacy', 'private'),
-            'entry_fee': data.get('entry_fee', 0),
-            'created_at': datetime.utcnow().isoformat(),
-            'member_count': 1
-        }
-        
-        return jsonify({
-            'status': 'success',
-            'data': new_group,
-            'message': 'Group created successfully'
-        }), 201
-    except Exception as e:
-        logger.error(f"Error creating group: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+    data = request.get_json()
+    
+    # Validate required fields
+    if not data.get('name'):
+        return ojson({'error': 'Group name is required'}), 400
+    
+    # Create group logic here
+    new_group = {
+        'id': 'group_id_placeholder',
+        'name': data.get('name'),
+        'description': data.get('description', ''),
+        'privacy': data.get('privacy', 'private'),
+        'entry_fee': data.get('entry_fee', 0),
+        'created_at': g.now_iso,
+        'member_count': 1
+    }
+    
+    return ojson({
+        'status': 'success',
+        'data': new_group,
+        'message': 'Group created successfully'
+    }), 201
 
 
 @api.route('/groups/<group_id>', methods=['GET'])
@@ -118,26 +401,22 @@ def get_group(group_id):
     Returns:
         - Group details including members and settings
     """
-    try:
-        # Database query logic here
-        group = {
-            'id': group_id,
-            'name': 'Group Name',
-            'description': 'Group description',
-            'privacy': 'private',
-            'entry_fee': 0,
-            'members': [],
-            'created_at': datetime.utcnow().isoformat(),
-            'settings': {}
-        }
-        
-        return jsonify({
-            'status': 'success',
-            'data': group
-        }), 200
-    except Exception as e:
-        logger.error(f"Error fetching group {group_id}: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+    # Database query logic here
+    group = {
+        'id': group_id,
+        'name': 'Group Name',
+        'description': 'Group description',
+        'privacy': 'private',
+        'entry_fee': 0,
+        'members': [],
+        'created_at': g.now_iso,
+        'settings': {}
+    }
+    
+    return ojson({
+        'status': 'success',
+        'data': group
+    }), 200
 
 
 @api.route('/groups/<group_id>', methods=['PUT'])
@@ -157,26 +436,22 @@ def update_group(group_id):
     Returns:
         - Updated group object
     """
-    try:
-        data = request.get_json()
-        
-        # Update logic here
-        updated_group = {
-            'id': group_id,
-            'name': data.get('name'),
-            'description': data.get('description'),
-            'privacy': data.get('privacy'),
-            'updated_at': datetime.utcnow().isoformat()
-        }
-        
-        return jsonify({
-            'status': 'success',
-            'data': updated_group,
-            'message': 'Group updated successfully'
-        }), 200
-    except Exception as e:
-        logger.error(f"Error updating group {group_id}: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+    data = request.get_json()
+    
+    # Update logic here
+    updated_group = {
+        'id': group_id,
+        'name': data.get('name'),
+        'description': data.get('description'),
+        'privacy': data.get('privacy'),
+        'updated_at': g.now_iso
+    }
+    
+    return ojson({
+        'status': 'success',
+        'data': updated_group,
+        'message': 'Group updated successfully'
+    }), 200
 
 
 @api.route('/groups/<group_id>', methods=['DELETE'])
@@ -191,15 +466,11 @@ def delete_group(group_id):
     Returns:
         - Confirmation message
     """
-    try:
-        # Delete logic here
-        return jsonify({
-            'status': 'success',
-            'message': f'Group {group_id} deleted successfully'
-        }), 200
-    except Exception as e:
-        logger.error(f"Error deleting group {group_id}: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+    # Delete logic here
+    return ojson({
+        'status': 'success',
+        'message': f'Group {group_id} deleted successfully'
+    }), 200
 
 
 @api.route('/groups/<group_id>/members', methods=['GET'])
@@ -214,17 +485,13 @@ def get_group_members(group_id):
     Returns:
         - List of group members with their statistics
     """
-    try:
-        members = []  # Placeholder for actual DB query
-        
-        return jsonify({
-            'status': 'success',
-            'data': members,
-            'total_members': len(members)
-        }), 200
-    except Exception as e:
-        logger.error(f"Error fetching group members: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+    members = []  # Placeholder for actual DB query
+    
+    return ojson({
+        'status': 'success',
+        'data': members,
+        'total_members': len(members)
+    }), 200
 
 
 @api.route('/groups/<group_id>/members', methods=['POST'])
@@ -243,20 +510,16 @@ def add_group_member(group_id):
     Returns:
         - Confirmation of added member
     """
-    try:
-        data = request.get_json()
-        
-        if not data.get('user_id') and not data.get('invite_code'):
-            return jsonify({'error': 'User ID or invite code required'}), 400
-        
-        # Add member logic here
-        return jsonify({
-            'status': 'success',
-            'message': 'Member added to group successfully'
-        }), 201
-    except Exception as e:
-        logger.error(f"Error adding member to group: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+    data = request.get_json()
+    
+    if not data.get('user_id') and not data.get('invite_code'):
+        return ojson({'error': 'User ID or invite code required'}), 400
+    
+    # Add member logic here
+    return ojson({
+        'status': 'success',
+        'message': 'Member added to group successfully'
+    }), 201
 
 
 @api.route('/groups/<group_id>/members/<member_id>', methods=['DELETE'])
@@ -272,15 +535,11 @@ def remove_group_member(group_id, member_id):
     Returns:
         - Confirmation message
     """
-    try:
-        # Remove member logic here
-        return jsonify({
-            'status': 'success',
-            'message': f'Member {member_id} removed from group'
-        }), 200
-    except Exception as e:
-        logger.error(f"Error removing group member: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+    # Remove member logic here
+    return ojson({
+        'status': 'success',
+        'message': f'Member {member_id} removed from group'
+    }), 200
 
 
 @api.route('/groups/<group_id>/invite-code', methods=['GET'])
@@ -295,29 +554,59 @@ def get_group_invite_code(group_id):
     Returns:
         - Invite code and expiration info
     """
-    try:
-        invite_code = {
-            'code': 'ABC123XYZ',
-            'group_id': group_id,
-            'created_at': datetime.utcnow().isoformat(),
-            'expires_at': '2026-02-08T05:38:45Z',
-            'uses': 0,
-            'max_uses': None
-        }
-        
-        return jsonify({
-            'status': 'success',
-            'data': invite_code
-        }), 200
-    except Exception as e:
-        logger.error(f"Error getting invite code: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+    invite_code = {
+        'code': 'ABC123XYZ',
+        'group_id': group_id,
+        'created_at': g.now_iso,
+        'expires_at': '2026-02-08T05:38:45Z',
+        'uses': 0,
+        'max_uses': None
+    }
+    
+    return ojson({
+        'status': 'success',
+        'data': invite_code
+    }), 200
 
 
 # ============================================================================
 # NBA DATA ROUTES
 # ============================================================================
 
+def _build_team_payloads():
+    """
+    Serialize the static nba_api team list once at import.
+    
+    Returns:
+        - (list payload, {team id or abbreviation: detail payload})
+    """
+    teams = nba_teams.get_teams()
+    teams_payload = orjson.dumps({
+        'status': 'success',
+        'data': teams,
+        'total_teams': len(teams)
+    })
+    details = {}
+    for team in teams:
+        payload = orjson.dumps({
+            'status': 'success',
+            'data': {
+                'id': team['id'],
+                'name': team['full_name'],
+                'abbreviation': team['abbreviation'],
+                'roster': [],
+                'stats': {},
+                'recent_games': []
+            }
+        })
+        details[str(team['id'])] = payload
+        details[team['abbreviation'].upper()] = payload
+    return teams_payload, details
+
+
+_TEAMS_PAYLOAD, _TEAM_DETAIL_PAYLOADS = _build_team_payloads()
+
+
 @api.route('/nba/games', methods=['GET'])
 def get_nba_games():
     """
@@ -331,21 +620,15 @@ def get_nba_games():
     Returns:
         - List of games with odds and details
     """
-    try:
-        date = request.args.get('date')
-        team = request.args.get('team')
-        status = request.args.get('status', 'upcoming')
-        
-        games = []  # Placeholder for actual NBA API integration
-        
-        return jsonify({
-            'status': 'success',
-            'data': games,
-            'count': len(games)
-        }), 200
-    except Exception as e:
-        logger.error(f"Error fetching NBA games: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+    query = parse_query(GamesQuery)
+    
+    games = []  # Placeholder for actual NBA API integration
+    
+    return ojson({
+        'status': 'success',
+        'data': games,
+        'count': len(games)
+    }), 200
 
 
 @api.route('/nba/games/<game_id>', methods=['GET'])
@@ -359,23 +642,19 @@ def get_game_details(game_id):
     Returns:
         - Game details including teams, odds, stats, and lines
     """
-    try:
-        game = {
-            'id': game_id,
-            'date': datetime.utcnow().isoformat(),
-            'home_team': {},
-            'away_team': {},
-            'odds': {},
-            'stats': {}
-        }
-        
-        return jsonify({
-            'status': 'success',
-            'data': game
-        }), 200
-    except Exception as e:
-        logger.error(f"Error fetching game details: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+    game = {
+        'id': game_id,
+        'date': g.now_iso,
+        'home_team': {},
+        'away_team': {},
+        'odds': {},
+        'stats': {}
+    }
+    
+    return ojson({
+        'status': 'success',
+        'data': game
+    }), 200
 
 
 @api.route('/nba/standings', methods=['GET'])
@@ -390,20 +669,15 @@ def get_standings():
     Returns:
         - League standings with records and stats
     """
-    try:
-        conference = request.args.get('conference')
-        season = request.args.get('season')
-        
-        standings = []  # Placeholder for actual data
-        
-        return jsonify({
-            'status': 'success',
-            'data': standings,
-            'season': season or 2025
-        }), 200
-    except Exception as e:
-        logger.error(f"Error fetching standings: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+    query = parse_query(StandingsQuery)
+    
+    standings = []  # Placeholder for actual data
+    
+    return ojson({
+        'status': 'success',
+        'data': standings,
+        'season': query.season or 2025
+    }), 200
 
 
 @api.route('/nba/teams', methods=['GET'])
@@ -414,17 +688,7 @@ def get_teams():
     Returns:
         - List of all NBA teams with info
     """
-    try:
-        teams = []  # Placeholder for actual data
-        
-        return jsonify({
-            'status': 'success',
-            'data': teams,
-            'total_teams': len(teams)
-        }), 200
-    except Exception as e:
-        logger.error(f"Error fetching teams: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+    return current_app.response_class(_TEAMS_PAYLOAD, mimetype='application/json'), 200
 
 
 @api.route('/nba/teams/<team_id>', methods=['GET'])
@@ -438,23 +702,11 @@ def get_team_details(team_id):
     Returns:
         - Team details, roster, stats, and recent performance
     """
-    try:
-        team = {
-            'id': team_id,
-            'name': 'Team Name',
-            'abbreviation': 'TM',
-            'roster': [],
-            'stats': {},
-            'recent_games': []
-        }
-        
-        return jsonify({
-            'status': 'success',
-            'data': team
-        }), 200
-    except Exception as e:
-        logger.error(f"Error fetching team details: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+    payload = _TEAM_DETAIL_PAYLOADS.get(team_id.upper())
+    if payload is None:
+        return ojson({'error': 'Team not found'}), 404
+    
+    return current_app.response_class(payload, mimetype='application/json'), 200
 
 
 @api.route('/nba/lines', methods=['GET'])
@@ -469,19 +721,14 @@ def get_betting_lines():
     Returns:
         - Betting lines with spreads, totals, and moneylines
     """
-    try:
-        game_id = request.args.get('game_id')
-        date = request.args.get('date')
-        
-        lines = []  # Placeholder for actual data
-        
-        return jsonify({
-            'status': 'success',
-            'data': lines
-        }), 200
-    except Exception as e:
-        logger.error(f"Error fetching betting lines: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+    query = parse_query(LinesQuery)
+    
+    lines = []  # Placeholder for actual data
+    
+    return ojson({
+        'status': 'success',
+        'data': lines
+    }), 200
 
 
 @api.route('/nba/player/<player_id>', methods=['GET'])
@@ -495,23 +742,19 @@ def get_player_stats(player_id):
     Returns:
         - Player stats, career info, and recent performance
     """
-    try:
-        player = {
-            'id': player_id,
-            'name': 'Player Name',
-            'team': 'Team',
-            'position': 'Position',
-            'stats': {},
-            'recent_games': []
-        }
-        
-        return jsonify({
-            'status': 'success',
-            'data': player
-        }), 200
-    except Exception as e:
-        logger.error(f"Error fetching player stats: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+    player = {
+        'id': player_id,
+        'name': 'Player Name',
+        'team': 'Team',
+        'position': 'Position',
+        'stats': {},
+        'recent_games': []
+    }
+    
+    return ojson({
+        'status': 'success',
+        'data': player
+    }), 200
 
 
 # ============================================================================
@@ -533,22 +776,15 @@ def get_picks():
     Returns:
         - List of user picks with details and results
     """
-    try:
-        group_id = request.args.get('group_id')
-        status = request.args.get('status')
-        start_date = request.args.get('start_date')
-        end_date = request.args.get('end_date')
-        
-        picks = []  # Placeholder for actual DB query
-        
-        return jsonify({
-            'status': 'success',
-            'data': picks,
-            'total': len(picks)
-        }), 200
-    except Exception as e:
-        logger.error(f"Error fetching picks: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+    query = parse_query(PicksQuery)
+    
+    picks = []  # Placeholder: models.paged_picks(db, *filters, limit=..., offset=...)
+    
+    return ojson({
+        'status': 'success',
+        'data': picks,
+        'total': len(picks)
+    }), 200
 
 
 @api.route('/picks', methods=['POST'])
@@ -569,38 +805,39 @@ def create_pick():
     Returns:
         - Created pick object
     """
-    try:
-        data = request.get_json()
-        
-        # Validate required fields
-        required_fields = ['game_id', 'group_id', 'pick_type', 'selection', 'line']
-        for field in required_fields:
-            if not data.get(field):
-                return jsonify({'error': f'{field} is required'}), 400
-        
-        # Create pick logic here
-        new_pick = {
-            'id': 'pick_id_placeholder',
-            'user_id': 'user_id_placeholder',
-            'game_id': data.get('game_id'),
-            'group_id': data.get('group_id'),
-            'pick_type': data.get('pick_type'),
-            'selection': data.get('selection'),
-            'line': data.get('line'),
-            'stake': data.get('stake', 0),
-            'confidence': data.get('confidence', 5),
-            'status': 'pending',
-            'created_at': datetime.utcnow().isoformat()
-        }
-        
-        return jsonify({
-            'status': 'success',
-            'data': new_pick,
-            'message': 'Pick created successfully'
-        }), 201
-    except Exception as e:
-        logger.error(f"Error creating pick: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+    data = request.get_json(silent=True)
+    if data is None:
+        data = {}
+    elif not isinstance(data, dict):
+        raise InvalidRequest('JSON object body required')
+    
+    # Validate required fields, reporting every missing one at once. Falsy
+    # values such as a pick'em line of 0 are valid; only null / '' are missing.
+    missing = _REQUIRED_PICK_FIELDS.difference(k for k, v in data.items() if v not in (None, ''))
+    if missing:
+        return ojson({'error': 'missing required fields', 'fields': sorted(missing)}), 400
+    
+    # Create pick logic here
+    new_pick = {
+        'id': 'pick_id_placeholder',
+        'user_id': 'user_id_placeholder',
+        'game_id': data.get('game_id'),
+        'group_id': data.get('group_id'),
+        'pick_type': data.get('pick_type'),
+        'selection': data.get('selection'),
+        'line': data.get('line'),
+        'stake': data.get('stake', 0),
+        'confidence': data.get('confidence', 5),
+        'status': 'pending',
+        'created_at': g.now_iso
+    }
+    
+    invalidate_read_cache()
+    return ojson({
+        'status': 'success',
+        'data': new_pick,
+        'message': 'Pick created successfully'
+    }), 201
 
 
 @api.route('/picks/<pick_id>', methods=['GET'])
@@ -615,25 +852,21 @@ def get_pick(pick_id):
     Returns:
         - Pick details with game info and result
     """
-    try:
-        pick = {
-            'id': pick_id,
-            'user_id': 'user_id',
-            'game_id': 'game_id',
-            'pick_type': 'spread',
-            'selection': 'Team Name',
-            'line': -5.5,
-            'status': 'pending',
-            'created_at': datetime.utcnow().isoformat()
-        }
-        
-        return jsonify({
-            'status': 'success',
-            'data': pick
-        }), 200
-    except Exception as e:
-        logger.error(f"Error fetching pick {pick_id}: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+    pick = {
+        'id': pick_id,
+        'user_id': 'user_id',
+        'game_id': 'game_id',
+        'pick_type': 'spread',
+        'selection': 'Team Name',
+        'line': -5.5,
+        'status': 'pending',
+        'created_at': g.now_iso
+    }
+    
+    return ojson({
+        'status': 'success',
+        'data': pick
+    }), 200
 
 
 @api.route('/picks/<pick_id>', methods=['PUT'])
@@ -653,26 +886,23 @@ def update_pick(pick_id):
     Returns:
         - Updated pick object
     """
-    try:
-        data = request.get_json()
-        
-        # Update logic here
-        updated_pick = {
-            'id': pick_id,
-            'selection': data.get('selection'),
-            'line': data.get('line'),
-            'stake': data.get('stake'),
-            'updated_at': datetime.utcnow().isoformat()
-        }
-        
-        return jsonify({
-            'status': 'success',
-            'data': updated_pick,
-            'message': 'Pick updated successfully'
-        }), 200
-    except Exception as e:
-        logger.error(f"Error updating pick {pick_id}: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+    data = request.get_json()
+    
+    # Update logic here
+    updated_pick = {
+        'id': pick_id,
+        'selection': data.get('selection'),
+        'line': data.get('line'),
+        'stake': data.get('stake'),
+        'updated_at': g.now_iso
+    }
+    
+    invalidate_read_cache()
+    return ojson({
+        'status': 'success',
+        'data': updated_pick,
+        'message': 'Pick updated successfully'
+    }), 200
 
 
 @api.route('/picks/<pick_id>', methods=['DELETE'])
@@ -687,15 +917,12 @@ def delete_pick(pick_id):
     Returns:
         - Confirmation message
     """
-    try:
-        # Delete logic here
-        return jsonify({
-            'status': 'success',
-            'message': f'Pick {pick_id} deleted successfully'
-        }), 200
-    except Exception as e:
-        logger.error(f"Error deleting pick {pick_id}: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+    # Delete logic here
+    invalidate_read_cache()
+    return ojson({
+        'status': 'success',
+        'message': f'Pick {pick_id} deleted successfully'
+    }), 200
 
 
 @api.route('/picks/group/<group_id>', methods=['GET'])
@@ -713,28 +940,67 @@ def get_group_picks(group_id):
     
     Returns:
         - List of all picks in the group
+        - One pick per line with Accept: application/x-ndjson
     """
-    try:
-        status = request.args.get('status')
-        user_id = request.args.get('user_id')
-        
-        picks = []  # Placeholder for actual DB query
-        
-        return jsonify({
-            'status': 'success',
-            'data': picks,
-            'total': len(picks)
-        }), 200
-    except Exception as e:
-        logger.error(f"Error fetching group picks: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+    query = parse_query(GroupPicksQuery)
+    
+    picks = []  # Placeholder: models.paged_picks(db, Pick.group_id == group_id, ...)
+    
+    if wants_ndjson():
+        return ndjson_stream(picks), 200
+    
+    return ojson({
+        'status': 'success',
+        'data': picks,
+        'total': len(picks)
+    }), 200
 
 
 # ============================================================================
 # LEADERBOARD ROUTES
 # ============================================================================
 
+def encode_cursor(rank):
+    """Opaque cursor resuming after the leaderboard row with this rank"""
+    return base64.urlsafe_b64encode(orjson.dumps([rank])).decode('ascii')
+
+
+def decode_cursor(cursor):
+    """Inverse of encode_cursor; raises InvalidRequest on a malformed cursor"""
+    try:
+        (rank,) = orjson.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except (ValueError, TypeError):
+        raise InvalidRequest('Invalid cursor') from None
+    if not isinstance(rank, int) or isinstance(rank, bool) or rank < 0:
+        raise InvalidRequest('Invalid cursor')
+    return rank
+
+
+def leaderboard_page(query):
+    """
+    Resolve leaderboard paging arguments from a parsed PageQuery
+    
+    Leaderboard rows carry a dense 1-based rank (see models.LeaderboardSnapshot)
+    and a page is the next `limit` rows with rank > after_rank, a range on the
+    (group_id, period, rank) index. A cursor and an offset both resolve to that
+    bound, so deep pages cost the same as the first.
+    
+    Returns:
+        - (limit, after_rank)
+    """
+    if query.cursor:
+        return query.limit, decode_cursor(query.cursor)
+    return query.limit, query.offset
+
+
+def next_cursor(rows, limit):
+    """Cursor for the page after rows, or None when this was the last page"""
+    if not rows or len(rows) < limit:
+        return None
+    return encode_cursor(rows[-1]['rank'])
+
 @api.route('/leaderboards/group/<group_id>', methods=['GET'])
+@cached_read(LeaderboardQuery, ttl=30, long_ttl=300)
 def get_group_leaderboard(group_id):
     """
     Get leaderboard for a specific group
@@ -744,33 +1010,38 @@ def get_group_leaderboard(group_id):
     
     Query Parameters:
         - period (string, optional): 'all_time', 'season', 'month', 'week'
-        - limit (integer, optional): Number of results to return (default 100)
-        - offset (integer, optional): Pagination offset (default 0)
+        - limit (integer, optional): Number of results to return (default 100, max 500)
+        - cursor (string, optional): next_cursor from the previous page
+        - offset (integer, optional): Rows to skip (default 0)
     
     Returns:
         - Ranked list of group members with their stats
-    """
-    try:
-        period = request.args.get('period', 'season')
-        limit = request.args.get('limit', 100, type=int)
-        offset = request.args.get('offset', 0, type=int)
-        
-        leaderboard = []  # Placeholder for actual DB query
-        
-        return jsonify({
-            'status': 'success',
-            'data': leaderboard,
-            'period': period,
-            'total': len(leaderboard),
-            'limit': limit,
-            'offset': offset
-        }), 200
-    except Exception as e:
-        logger.error(f"Error fetching group leaderboard: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+        - One row per line with Accept: application/x-ndjson (next page in X-Next-Cursor)
+    """
+    query = parse_query(LeaderboardQuery)
+    period = query.period
+    limit, after_rank = leaderboard_page(query)
+    
+    # Placeholder: models.leaderboard_snapshot(db, group_id, period, limit, after_rank),
+    # precomputed by models.refresh_leaderboard_snapshots
+    leaderboard = []
+    
+    if wants_ndjson():
+        return ndjson_stream(leaderboard, next_cursor(leaderboard, limit)), 200
+    
+    return ojson({
+        'status': 'success',
+        'data': leaderboard,
+        'period': period,
+        'total': len(leaderboard),
+        'limit': limit,
+        'offset': after_rank,
+        'next_cursor': next_cursor(leaderboard, limit)
+    }), 200
 
 
 @api.route('/leaderboards/user/<user_id>', methods=['GET'])
+@cached_read(PeriodQuery, ttl=30, long_ttl=300)
 def get_user_leaderboard_stats(user_id):
     """
     Get user's leaderboard statistics and rank across groups
@@ -784,59 +1055,59 @@ def get_user_leaderboard_stats(user_id):
     Returns:
         - User stats and ranks across groups
     """
-    try:
-        period = request.args.get('period', 'season')
-        
-        stats = {
-            'user_id': user_id,
-            'period': period,
-            'groups': [],
-            'overall_stats': {}
-        }
-        
-        return jsonify({
-            'status': 'success',
-            'data': stats
-        }), 200
-    except Exception as e:
-        logger.error(f"Error fetching user leaderboard stats: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+    period = parse_query(PeriodQuery).period
+    
+    stats = {
+        'user_id': user_id,
+        'period': period,
+        'groups': [],
+        'overall_stats': {}
+    }
+    
+    return ojson({
+        'status': 'success',
+        'data': stats
+    }), 200
 
 
 @api.route('/leaderboards/global', methods=['GET'])
+@cached_read(LeaderboardQuery, ttl=30, long_ttl=300)
 def get_global_leaderboard():
     """
     Get global leaderboard across all groups
     
     Query Parameters:
         - period (string, optional): 'all_time', 'season', 'month', 'week'
-        - limit (integer, optional): Number of results to return (default 100)
-        - offset (integer, optional): Pagination offset (default 0)
+        - limit (integer, optional): Number of results to return (default 100, max 500)
+        - cursor (string, optional): next_cursor from the previous page
+        - offset (integer, optional): Rows to skip (default 0)
     
     Returns:
         - Top users globally with their stats
+        - One row per line with Accept: application/x-ndjson (next page in X-Next-Cursor)
     """
-    try:
-        period = request.args.get('period', 'season')
-        limit = request.args.get('limit', 100, type=int)
-        offset = request.args.get('offset', 0, type=int)
-        
-        leaderboard = []  # Placeholder for actual DB query
-        
-        return jsonify({
-            'status': 'success',
-            'data': leaderboard,
-            'period': period,
-            'total': len(leaderboard),
-            'limit': limit,
-            'offset': offset
-        }), 200
-    except Exception as e:
-        logger.error(f"Error fetching global leaderboard: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+    query = parse_query(LeaderboardQuery)
+    period = query.period
+    limit, after_rank = leaderboard_page(query)
+    
+    leaderboard = []  # Placeholder for actual DB query (rows ranked after after_rank)
+    
+    if wants_ndjson():
+        return ndjson_stream(leaderboard, next_cursor(leaderboard, limit)), 200
+    
+    return ojson({
+        'status': 'success',
+        'data': leaderboard,
+        'period': period,
+        'total': len(leaderboard),
+        'limit': limit,
+        'offset': after_rank,
+        'next_cursor': next_cursor(leaderboard, limit)
+    }), 200
 
 
 @api.route('/leaderboards/stats/<stat_type>', methods=['GET'])
+@cached_read(StatLeaderboardQuery, ttl=30)
 def get_leaderboard_by_stat(stat_type):
     """
     Get leaderboard sorted by specific statistic
@@ -847,34 +1118,33 @@ def get_leaderboard_by_stat(stat_type):
                   'roi', 'accuracy', 'streak'
     
     Query Parameters:
-        - limit (integer, optional): Number of results to return
+        - limit (integer, optional): Number of results to return (default 100, max 500)
+        - cursor (string, optional): next_cursor from the previous page
+        - offset (integer, optional): Rows to skip (default 0)
         - group_id (string, optional): Filter by specific group
     
     Returns:
         - Leaderboard sorted by specified stat
     """
-    try:
-        limit = request.args.get('limit', 100, type=int)
-        group_id = request.args.get('group_id')
-        
-        valid_stats = ['wins', 'losses', 'win_percentage', 'profit_loss', 
-                      'roi', 'accuracy', 'streak']
-        
-        if stat_type not in valid_stats:
-            return jsonify({'error': f'Invalid stat type. Must be one of {valid_stats}'}), 400
-        
-        leaderboard = []  # Placeholder for actual DB query
-        
-        return jsonify({
-            'status': 'success',
-            'data': leaderboard,
-            'stat_type': stat_type,
-            'total': len(leaderboard),
-            'limit': limit
-        }), 200
-    except Exception as e:
-        logger.error(f"Error fetching leaderboard by stat: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+    query = parse_query(StatLeaderboardQuery)
+    limit, after_rank = leaderboard_page(query)
+    
+    valid_stats = ['wins', 'losses', 'win_percentage', 'profit_loss', 
+                  'roi', 'accuracy', 'streak']
+    
+    if stat_type not in valid_stats:
+        return ojson({'error': f'Invalid stat type. Must be one of {valid_stats}'}), 400
+    
+    leaderboard = []  # Placeholder for actual DB query (rows ranked after after_rank)
+    
+    return ojson({
+        'status': 'success',
+        'data': leaderboard,
+        'stat_type': stat_type,
+        'total': len(leaderboard),
+        'limit': limit,
+        'next_cursor': next_cursor(leaderboard, limit)
+    }), 200
 
 
 @api.route('/leaderboards/head-to-head', methods=['GET'])
@@ -891,35 +1161,25 @@ def get_head_to_head():
     Returns:
         - Head-to-head stats and comparison
     """
-    try:
-        user_id_1 = request.args.get('user_id_1')
-        user_id_2 = request.args.get('user_id_2')
-        group_id = request.args.get('group_id')
-        period = request.args.get('period', 'season')
-        
-        if not user_id_1 or not user_id_2:
-            return jsonify({'error': 'Both user_id_1 and user_id_2 are required'}), 400
-        
-        comparison = {
-            'user_1': {
-                'id': user_id_1,
-                'stats': {}
-            },
-            'user_2': {
-                'id': user_id_2,
-                'stats': {}
-            },
-            'head_to_head_record': None,
-            'period': period
-        }
-        
-        return jsonify({
-            'status': 'success',
-            'data': comparison
-        }), 200
-    except Exception as e:
-        logger.error(f"Error fetching head-to-head: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+    query = parse_query(HeadToHeadQuery)
+    
+    comparison = {
+        'user_1': {
+            'id': query.user_id_1,
+            'stats': {}
+        },
+        'user_2': {
+            'id': query.user_id_2,
+            'stats': {}
+        },
+        'head_to_head_record': None,
+        'period': query.period
+    }
+    
+    return ojson({
+        'status': 'success',
+        'data': comparison
+    }), 200
 
 
 # ============================================================================
@@ -928,6 +1188,7 @@ def get_head_to_head():
 
 @api.route('/stats/user/<user_id>', methods=['GET'])
 @token_required
+@cached_read(ttl=60)
 def get_user_stats(user_id):
     """
     Get comprehensive statistics for a user
@@ -938,32 +1199,29 @@ def get_user_stats(user_id):
     Returns:
         - User stats including wins, losses, ROI, accuracy, etc.
     """
-    try:
-        stats = {
-            'user_id': user_id,
-            'total_picks': 0,
-            'wins': 0,
-            'losses': 0,
-            'pushes': 0,
-            'win_percentage': 0.0,
-            'total_profit_loss': 0.0,
-            'roi': 0.0,
-            'current_streak': 0,
-            'best_streak': 0,
-            'picks_by_type': {},
-            'picks_by_sport': {}
-        }
-        
-        return jsonify({
-            'status': 'success',
-            'data': stats
-        }), 200
-    except Exception as e:
-        logger.error(f"Error fetching user stats: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+    stats = {
+        'user_id': user_id,
+        'total_picks': 0,
+        'wins': 0,
+        'losses': 0,
+        'pushes': 0,
+        'win_percentage': 0.0,
+        'total_profit_loss': 0.0,
+        'roi': 0.0,
+        'current_streak': 0,
+        'best_streak': 0,
+        'picks_by_type': {},
+        'picks_by_sport': {}
+    }
+    
+    return ojson({
+        'status': 'success',
+        'data': stats
+    }), 200
 
 
 @api.route('/stats/group/<group_id>/summary', methods=['GET'])
+@cached_read(ttl=60)
 def get_group_stats_summary(group_id):
     """
     Get summary statistics for a group
@@ -974,24 +1232,20 @@ def get_group_stats_summary(group_id):
     Returns:
         - Group-wide statistics and metrics
     """
-    try:
-        summary = {
-            'group_id': group_id,
-            'total_members': 0,
-            'total_picks': 0,
-            'total_wagered': 0.0,
-            'group_roi': 0.0,
-            'average_accuracy': 0.0,
-            'most_profitable_member': None
-        }
-        
-        return jsonify({
-            'status': 'success',
-            'data': summary
-        }), 200
-    except Exception as e:
-        logger.error(f"Error fetching group stats: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+    summary = {
+        'group_id': group_id,
+        'total_members': 0,
+        'total_picks': 0,
+        'total_wagered': 0.0,
+        'group_roi': 0.0,
+        'average_accuracy': 0.0,
+        'most_profitable_member': None
+    }
+    
+    return ojson({
+        'status': 'success',
+        'data': summary
+    }), 200
 
 
 # ============================================================================
@@ -1006,25 +1260,20 @@ def get_notifications():
     
     Query Parameters:
         - unread_only (boolean, optional): Only get unread notifications
-        - limit (integer, optional): Number of results to return
+        - limit (integer, optional): Number of results to return (default 50, max 500)
     
     Returns:
         - List of notifications
     """
-    try:
-        unread_only = request.args.get('unread_only', False, type=bool)
-        limit = request.args.get('limit', 50, type=int)
-        
-        notifications = []  # Placeholder for actual DB query
-        
-        return jsonify({
-            'status': 'success',
-            'data': notifications,
-            'unread_count': 0
-        }), 200
-    except Exception as e:
-        logger.error(f"Error fetching notifications: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+    query = parse_query(NotificationsQuery)
+    
+    notifications = []  # Placeholder for actual DB query
+    
+    return ojson({
+        'status': 'success',
+        'data': notifications,
+        'unread_count': 0
+    }), 200
 
 
 @api.route('/notifications/<notification_id>/read', methods=['PUT'])
@@ -1039,14 +1288,10 @@ def mark_notification_read(notification_id):
     Returns:
         - Confirmation message
     """
-    try:
-        return jsonify({
-            'status': 'success',
-            'message': 'Notification marked as read'
-        }), 200
-    except Exception as e:
-        logger.error(f"Error marking notification as read: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+    return ojson({
+        'status': 'success',
+        'message': 'Notification marked as read'
+    }), 200
 
 
 @api.route('/activity/<group_id>', methods=['GET'])
@@ -1059,26 +1304,25 @@ def get_group_activity(group_id):
         - group_id (string): ID of the group
     
     Query Parameters:
-        - limit (integer, optional): Number of results to return
+        - limit (integer, optional): Number of results to return (default 50, max 500)
         - activity_type (string, optional): Filter by type (pick, member_join, game_result)
     
     Returns:
         - Activity feed for the group
+        - One activity per line with Accept: application/x-ndjson
     """
-    try:
-        limit = request.args.get('limit', 50, type=int)
-        activity_type = request.args.get('activity_type')
-        
-        activity = []  # Placeholder for actual DB query
-        
-        return jsonify({
-            'status': 'success',
-            'data': activity,
-            'total': len(activity)
-        }), 200
-    except Exception as e:
-        logger.error(f"Error fetching group activity: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+    query = parse_query(ActivityQuery)
+    
+    activity = []  # Placeholder for actual DB query
+    
+    if wants_ndjson():
+        return ndjson_stream(activity), 200
+    
+    return ojson({
+        'status': 'success',
+        'data': activity,
+        'total': len(activity)
+    }), 200
 
 
 # ============================================================================
@@ -1093,9 +1337,9 @@ def health_check():
     Returns:
         - API status and timestamp
     """
-    return jsonify({
+    return ojson({
         'status': 'healthy',
-        'timestamp': datetime.utcnow().isoformat(),
+        'timestamp': health_timestamp(),
         'version': '1.0.0'
     }), 200
 
@@ -1107,19 +1351,46 @@ def health_check():
 @api.errorhandler(404)
 def not_found(error):
     """Handle 404 errors"""
-    return jsonify({
+    return ojson({
         'status': 'error',
         'message': 'Resource not found',
         'error': str(error)
     }), 404
 
 
+@api.errorhandler(Exception)
+def unhandled_error(error):
+    """
+    Turn any exception escaping a view into a JSON error response
+    
+    Views let errors propagate instead of wrapping their bodies in try/except.
+    Input the views reject on purpose (InvalidRequest) reports its message; any
+    other error, including stray ValueErrors from bugs, answers with just the
+    status phrase, and 5xx ones are logged with their traceback.
+    """
+    if isinstance(error, HTTPException):
+        return ojson({
+            'status': 'error',
+            'message': error.description,
+            'error': error.name
+        }), error.code or 500
+    status = error_status(error)
+    if status >= 500:
+        logger.exception("Unhandled error in %s", request.endpoint)
+    message = str(error) if status == 400 else HTTPStatus(status).phrase
+    return ojson({
+        'status': 'error',
+        'message': message,
+        'error': message
+    }), status
+
+
 @api.errorhandler(500)
 def internal_error(error):
     """Handle 500 errors"""
-    logger.error(f"Internal server error: {str(error)}")
-    return jsonify({
+    logger.error("Internal server error: %s", error)
+    return ojson({
         'status': 'error',
         'message': 'Internal server error',
-        'error': str(error)
+        'error': 'Internal server error'
     }), 500
@@ -2,9 +2,10 @@
 Scoring module for NBA pick calculations and stats analysis.
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from operator import attrgetter, mul
 
 
 class StatType(Enum):
@@ -19,7 +20,11 @@ class StatType(Enum):
     FREE_THROW_PERCENTAGE = "ft_percentage"
 
 
-@dataclass
+# StatType -> getter for the PlayerStats field of the same name, built once.
+_STAT_GETTERS = {stat_type: attrgetter(stat_type.value) for stat_type in StatType}
+
+
+@dataclass(slots=True, frozen=True)
 class PlayerStats:
     """Data class representing player statistics."""
     player_name: str
@@ -36,20 +41,11 @@ class PlayerStats:
 
     def get_stat(self, stat_type: StatType) -> float:
         """Get a specific stat by type."""
-        stat_mapping = {
-            StatType.POINTS: self.points,
-            StatType.REBOUNDS: self.rebounds,
-            StatType.ASSISTS: self.assists,
-            StatType.STEALS: self.steals,
-            StatType.BLOCKS: self.blocks,
-            StatType.FIELD_GOAL_PERCENTAGE: self.fg_percentage,
-            StatType.THREE_POINT_PERCENTAGE: self.three_pt_percentage,
-            StatType.FREE_THROW_PERCENTAGE: self.ft_percentage,
-        }
-        return stat_mapping.get(stat_type, 0.0)
+        getter = _STAT_GETTERS.get(stat_type)
+        return getter(self) if getter is not None else 0.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Pick:
     """Data class representing a player pick."""
     player_name: str
@@ -66,6 +62,13 @@ class ScoringEngine:
     def __init__(self):
         """Initialize the scoring engine."""
         self.player_history: Dict[str, List[PlayerStats]] = {}
+        # (player_id, game_id) -> first PlayerStats recorded for that game
+        self._game_index: Dict[Tuple[str, str], PlayerStats] = {}
+        # player_id -> stat type -> that stat for every game, in history order
+        self._stat_columns: Dict[str, Dict[StatType, List[float]]] = {}
+        # player_id -> memoized results, dropped whenever that player's history changes
+        self._expected_memo: Dict[str, Dict[Tuple[StatType, int, bool], float]] = {}
+        self._summary_memo: Dict[str, Dict[int, Dict[str, float]]] = {}
         self.picks: List[Pick] = []
 
     def compute_expected_stats(
@@ -87,27 +90,36 @@ class ScoringEngine:
         Returns:
             Expected stat value as a float
         """
-        if player_id not in self.player_history:
+        columns = self._stat_columns.get(player_id)
+        if columns is None:
             return 0.0
 
-        history = self.player_history[player_id][-games_lookback:]
-
-        if not history:
+        column = columns.get(stat_type)
+        if column is None:
             return 0.0
 
-        if weight_recent:
+        memo = self._expected_memo.setdefault(player_id, {})
+        key = (stat_type, games_lookback, weight_recent)
+        expected = memo.get(key)
+        if expected is not None:
+            return expected
+
+        values = column[-games_lookback:]
+
+        if not values:
+            expected = 0.0
+        elif weight_recent:
             # Weight recent games more heavily using a linear weighting scheme
-            weights = [i + 1 for i in range(len(history))]
-            total_weight = sum(weights)
-            weighted_sum = sum(
-                stat.get_stat(stat_type) * weight
-                for stat, weight in zip(history, weights)
-            )
-            return weighted_sum / total_weight
+            n = len(values)
+            total_weight = n * (n + 1) // 2  # 1 + 2 + ... + n
+            weighted_sum = sum(map(mul, values, range(1, n + 1)))
+            expected = weighted_sum / total_weight
         else:
             # Simple average
-            total = sum(stat.get_stat(stat_type) for stat in history)
-            return total / len(history)
+            expected = sum(values) / len(values)
+
+        memo[key] = expected
+        return expected
 
     def compute_actual_stats(
         self,
@@ -124,14 +136,7 @@ class ScoringEngine:
         Returns:
             PlayerStats object if found, None otherwise
         """
-        if player_id not in self.player_history:
-            return None
-
-        for stats in self.player_history[player_id]:
-            if stats.game_id == game_id:
-                return stats
-
-        return None
+        return self._game_index.get((player_id, game_id))
 
     def compute_pick_score(
         self,
@@ -179,9 +184,34 @@ class ScoringEngine:
         Args:
             stats: PlayerStats object containing game statistics
         """
-        if stats.player_id not in self.player_history:
-            self.player_history[stats.player_id] = []
-        self.player_history[stats.player_id].append(stats)
+        self.add_player_game_stats_bulk((stats,))
+
+    def add_player_game_stats_bulk(self, stats_list: Iterable[PlayerStats]) -> None:
+        """
+        Add game statistics for many players at once, e.g. a whole box score.
+
+        Rows are grouped by player so each player's history, stat columns and
+        memoized results are touched once per batch.
+
+        Args:
+            stats_list: PlayerStats objects, in game order for each player
+        """
+        by_player: Dict[str, List[PlayerStats]] = {}
+        for stats in stats_list:
+            by_player.setdefault(stats.player_id, []).append(stats)
+
+        for player_id, batch in by_player.items():
+            history = self.player_history.get(player_id)
+            if history is None:
+                history = self.player_history[player_id] = []
+                self._stat_columns[player_id] = {stat_type: [] for stat_type in StatType}
+            history.extend(batch)
+            for stats in batch:
+                self._game_index.setdefault((player_id, stats.game_id), stats)
+            for stat_type, column in self._stat_columns[player_id].items():
+                column.extend(map(_STAT_GETTERS[stat_type], batch))
+            self._expected_memo.pop(player_id, None)
+            self._summary_memo.pop(player_id, None)
 
     def add_pick(self, pick: Pick) -> None:
         """
@@ -238,6 +268,7 @@ class ScoringEngine:
         Returns:
             List of evaluation results for each pick
         """
+        # Picks on the same player and stat share one memoized expected stat
         return [self.evaluate_pick(pick) for pick in self.picks]
 
     def get_player_stats_summary(
@@ -255,16 +286,28 @@ class ScoringEngine:
         Returns:
             Dictionary with stat types as keys and averages as values
         """
-        summary = {}
-        for stat_type in StatType:
-            summary[stat_type.value] = self.compute_expected_stats(
-                player_id,
-                stat_type,
-                games_lookback=games_lookback
-            )
-        return summary
+        columns = self._stat_columns.get(player_id)
+        if columns is None:
+            return {stat_type.value: 0.0 for stat_type in StatType}
+
+        memo = self._summary_memo.setdefault(player_id, {})
+        summary = memo.get(games_lookback)
+        if summary is None:
+            summary = memo[games_lookback] = {}
+            for stat_type, column in columns.items():
+                # Same weighting as compute_expected_stats, in one pass per column
+                values = column[-games_lookback:]
+                n = len(values)
+                summary[stat_type.value] = (
+                    sum(map(mul, values, range(1, n + 1))) / (n * (n + 1) // 2) if n else 0.0
+                )
+        return dict(summary)
 
     def clear_history(self) -> None:
         """Clear all player history and picks."""
         self.player_history.clear()
+        self._game_index.clear()
+        self._stat_columns.clear()
+        self._expected_memo.clear()
+        self._summary_memo.clear()
         self.picks.clear()
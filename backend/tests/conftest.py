@@ -0,0 +1,6 @@
+import os
+import sys
+
+# The legacy modules import each other flat and the app package lives beside
+# them, so tests run with backend/ on the path.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
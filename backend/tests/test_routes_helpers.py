@@ -0,0 +1,140 @@
+import base64
+from decimal import Decimal
+
+import pytest
+
+pytest.importorskip("flask")
+pytest.importorskip("pydantic")
+pytest.importorskip("nba_api")
+
+import orjson  # noqa: E402
+import requests  # noqa: E402
+from flask import Flask  # noqa: E402
+
+import routes  # noqa: E402
+from routes import (  # noqa: E402
+    InvalidRequest,
+    LeaderboardQuery,
+    PicksQuery,
+    decode_cursor,
+    encode_cursor,
+    error_status,
+    leaderboard_page,
+    next_cursor,
+    parse_query,
+)
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    app.register_blueprint(routes.api)
+    return app
+
+
+# ---------------------------------------------------------------------------
+# Cursors
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize('rank', [0, 1, 250, 10**9])
+def test_cursor_round_trip(rank):
+    assert decode_cursor(encode_cursor(rank)) == rank
+
+
+@pytest.mark.parametrize('cursor', [
+    'not base64!',
+    base64.urlsafe_b64encode(b'not json').decode(),
+    base64.urlsafe_b64encode(orjson.dumps(5)).decode(),
+    base64.urlsafe_b64encode(orjson.dumps([1, 2])).decode(),
+    base64.urlsafe_b64encode(orjson.dumps([-1])).decode(),
+    base64.urlsafe_b64encode(orjson.dumps([True])).decode(),
+    base64.urlsafe_b64encode(orjson.dumps(['3'])).decode(),
+    base64.urlsafe_b64encode(orjson.dumps([1.5])).decode(),
+])
+def test_decode_cursor_rejects_malformed(cursor):
+    with pytest.raises(InvalidRequest, match='Invalid cursor'):
+        decode_cursor(cursor)
+
+
+def test_leaderboard_page_prefers_cursor():
+    query = LeaderboardQuery(limit=20, offset=40, cursor=encode_cursor(7))
+    assert leaderboard_page(query) == (20, 7)
+    assert leaderboard_page(LeaderboardQuery(limit=20, offset=40)) == (20, 40)
+
+
+def test_next_cursor_only_for_full_pages():
+    rows = [{'rank': 1}, {'rank': 2}, {'rank': 2}]
+    assert decode_cursor(next_cursor(rows, 3)) == 2
+    assert next_cursor(rows, 4) is None
+    assert next_cursor([], 3) is None
+
+
+# ---------------------------------------------------------------------------
+# Error mapping
+# ---------------------------------------------------------------------------
+
+def _http_error(status):
+    response = requests.Response()
+    response.status_code = status
+    return requests.HTTPError(response=response)
+
+
+@pytest.mark.parametrize('exc, status', [
+    (InvalidRequest('bad'), 400),
+    (TimeoutError(), 504),
+    (requests.Timeout(), 504),
+    (requests.ConnectTimeout(), 504),
+    (_http_error(429), 429),
+    (_http_error(503), 502),
+    (requests.HTTPError(), 502),
+    (requests.ConnectionError(), 502),
+    (ValueError('boom'), 500),
+])
+def test_error_status(exc, status):
+    assert error_status(exc) == status
+
+
+# ---------------------------------------------------------------------------
+# Query parsing
+# ---------------------------------------------------------------------------
+
+def test_parse_query_coerces_and_defaults(app):
+    with app.test_request_context('/?limit=25&period=week&ignored=1'):
+        query = parse_query(LeaderboardQuery)
+        assert (query.limit, query.offset, query.cursor, query.period) == (25, 0, None, 'week')
+
+
+def test_parse_query_is_memoized_per_request(app):
+    with app.test_request_context('/?limit=25'):
+        assert parse_query(LeaderboardQuery) is parse_query(LeaderboardQuery)
+    with app.test_request_context('/?limit=30'):
+        assert parse_query(LeaderboardQuery).limit == 30
+
+
+@pytest.mark.parametrize('args, field', [
+    ('limit=0', 'limit'),
+    (f'limit={routes.MAX_PAGE_LIMIT + 1}', 'limit'),
+    ('offset=-1', 'offset'),
+    ('limit=ten', 'limit'),
+    ('period=yearly', 'period'),
+])
+def test_parse_query_rejects_invalid(app, args, field):
+    with app.test_request_context(f'/?{args}'):
+        with pytest.raises(InvalidRequest, match=rf'^{field}: '):
+            parse_query(LeaderboardQuery)
+
+
+def test_parse_query_rejects_unknown_status(app):
+    with app.test_request_context('/?status=maybe'):
+        with pytest.raises(InvalidRequest, match='status'):
+            parse_query(PicksQuery)
+
+
+# ---------------------------------------------------------------------------
+# JSON
+# ---------------------------------------------------------------------------
+
+def test_ojson_shares_the_provider_default_hook(app):
+    payload = {'value': Decimal('1.5')}
+    with app.test_request_context('/'):
+        assert orjson.loads(routes.ojson(payload).get_data()) == orjson.loads(app.json.dumps(payload))
@@ -0,0 +1,72 @@
+import pytest
+
+from scoring import PlayerStats, ScoringEngine, StatType
+
+
+def _game(game_id, points, player_id="p1", **stats):
+    return PlayerStats(player_name="Player", player_id=player_id, game_id=game_id, points=points, **stats)
+
+
+@pytest.fixture
+def engine():
+    engine = ScoringEngine()
+    engine.add_player_game_stats_bulk(_game(f"g{i}", points) for i, points in enumerate([10, 20, 30]))
+    return engine
+
+
+def test_summary_weights_recent_games(engine):
+    summary = engine.get_player_stats_summary("p1")
+    # (10*1 + 20*2 + 30*3) / 6
+    assert summary["points"] == pytest.approx(140 / 6)
+    assert summary["points"] == engine.compute_expected_stats("p1", StatType.POINTS)
+    assert set(summary) == {stat_type.value for stat_type in StatType}
+
+
+def test_summary_honours_lookback(engine):
+    # (20*1 + 30*2) / 3
+    assert engine.get_player_stats_summary("p1", games_lookback=2)["points"] == pytest.approx(80 / 3)
+
+
+def test_summary_for_unknown_player_is_zeroed(engine):
+    assert engine.get_player_stats_summary("nobody") == {stat_type.value: 0.0 for stat_type in StatType}
+
+
+def test_summary_returns_a_copy(engine):
+    engine.get_player_stats_summary("p1")["points"] = -1.0
+    assert engine.get_player_stats_summary("p1")["points"] == pytest.approx(140 / 6)
+
+
+def test_new_games_invalidate_memos(engine):
+    before_summary = engine.get_player_stats_summary("p1")["points"]
+    before_expected = engine.compute_expected_stats("p1", StatType.POINTS, weight_recent=False)
+
+    engine.add_player_game_stats(_game("g3", 40))
+
+    # (10*1 + 20*2 + 30*3 + 40*4) / 10
+    assert engine.get_player_stats_summary("p1")["points"] == pytest.approx(30.0)
+    assert engine.compute_expected_stats("p1", StatType.POINTS, weight_recent=False) == pytest.approx(25.0)
+    assert before_summary != pytest.approx(30.0)
+    assert before_expected == pytest.approx(20.0)
+
+
+def test_new_games_leave_other_players_memos(engine):
+    engine.get_player_stats_summary("p1")
+    engine.add_player_game_stats(_game("g0", 5, player_id="p2"))
+
+    assert "p1" in engine._summary_memo
+    assert engine.get_player_stats_summary("p2")["points"] == pytest.approx(5.0)
+
+
+def test_clear_history_drops_memos(engine):
+    engine.get_player_stats_summary("p1")
+    engine.compute_expected_stats("p1", StatType.POINTS)
+
+    engine.clear_history()
+
+    assert engine.get_player_stats_summary("p1")["points"] == 0.0
+    assert engine.compute_expected_stats("p1", StatType.POINTS) == 0.0
+
+
+def test_actual_stats_keep_first_row_per_game(engine):
+    engine.add_player_game_stats(_game("g0", 99))
+    assert engine.compute_actual_stats("p1", "g0").points == 10
@@ -0,0 +1,52 @@
+import io
+
+import pytest
+
+pytest.importorskip("ijson")
+pytest.importorskip("requests")
+
+from app.sportsbook import _NESTED, _iter_dicts_streaming  # noqa: E402
+
+
+FEED = (
+    b'{"eventGroup": {"offers": [[{"label": "Points",'
+    b' "outcomes": [{"label": "Over", "line": 24.5, "participant": "A"},'
+    b' {"label": "Under", "line": 24.5, "tags": ["a"]}],'
+    b' "meta": {"x": 1}, "empty": []}]]}}'
+)
+
+
+def _dicts(raw):
+    return list(_iter_dicts_streaming(io.BytesIO(raw)))
+
+
+def test_objects_are_yielded_children_first():
+    labels = [d.get("label") for d in _dicts(FEED)]
+    assert labels == ["Over", "Under", None, "Points", None, None]
+
+
+def test_outcomes_are_kept_as_shallow_lists():
+    market = next(d for d in _dicts(FEED) if d.get("label") == "Points")
+    assert market["outcomes"] == [
+        {"label": "Over", "line": 24.5, "participant": "A"},
+        {"label": "Under", "line": 24.5, "tags": _NESTED},
+    ]
+    assert type(market["outcomes"][0]["line"]) is float
+
+
+def test_other_containers_become_placeholders_with_same_truthiness():
+    market = next(d for d in _dicts(FEED) if d.get("label") == "Points")
+    assert market["meta"] is _NESTED
+    assert market["empty"] == []
+    root = _dicts(FEED)[-1]
+    assert root == {"eventGroup": _NESTED}
+
+
+def test_empty_object_and_scalars():
+    assert _dicts(b'{"a": {}, "b": null, "c": true}') == [{}, {"a": {}, "b": None, "c": True}]
+
+
+def test_can_stop_early():
+    stream = _iter_dicts_streaming(io.BytesIO(FEED))
+    assert next(stream)["label"] == "Over"
+    stream.close()